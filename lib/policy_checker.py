@@ -4,10 +4,19 @@ Policy Checker Module
 Validates trust policies against required sections and best practices.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
+from pathlib import Path
 import yaml
 import json
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Issue severity levels
+ERROR = "error"
+WARNING = "warning"
+INFO = "info"
+
 
 class PolicyIssue:
     """Represents a policy validation issue."""
@@ -44,29 +53,37 @@ class PolicyChecker:
     Checks for required sections, recommended content, and common issues.
     """
 
+    __slots__ = ('issues', '_revision')
+
     # Required sections for a complete trust policy
-    REQUIRED_SECTIONS = [
+    REQUIRED_SECTIONS = (
         'scope',
         'responsibilities',
         'data_handling',
         'incident_response',
         'monitoring',
         'escalation',
-    ]
+    )
 
     # Recommended sections for robust policies
-    RECOMMENDED_SECTIONS = [
+    RECOMMENDED_SECTIONS = (
         'risk_assessment',
         'uncertainty_handling',
         'audit_trail',
         'user_consent',
         'model_governance',
         'deployment_process',
-    ]
+    )
 
     def __init__(self):
         """Initialize policy checker."""
         self.issues: List[PolicyIssue] = []
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped every time check_policy records new results."""
+        return self._revision
 
     def check_policy(self, policy: Dict[str, Any]) -> List[PolicyIssue]:
         """
@@ -78,64 +95,91 @@ class PolicyChecker:
         Returns:
             List of PolicyIssue objects
         """
-        self.issues = []
+        self.issues = list(self.iter_issues(policy))
+        self._revision += 1
+        return self.issues
+
+    def check_policies(self, policies: List[Dict[str, Any]]) -> List[List[PolicyIssue]]:
+        """
+        Check several policies in one call.
+
+        Like iter_issues, this does not touch self.issues.
+
+        Args:
+            policies: Policy dicts to check
+
+        Returns:
+            One list of PolicyIssue objects per policy, in input order
+        """
+        return [list(self.iter_issues(policy)) for policy in policies]
+
+    def iter_issues(self, policy: Dict[str, Any]) -> Iterator[PolicyIssue]:
+        """
+        Lazily yield policy issues as each check runs.
+
+        Unlike check_policy, this does not record results on the checker,
+        so callers that only need the first match can stop early.
 
+        Args:
+            policy: Policy dict (from YAML/JSON or constructed)
+
+        Yields:
+            PolicyIssue objects in the same order check_policy returns them
+        """
         # Check required sections
-        self._check_required_sections(policy)
+        yield from self._check_required_sections(policy)
 
         # Check recommended sections
-        self._check_recommended_sections(policy)
+        yield from self._check_recommended_sections(policy)
 
         # Check specific section content
-        self._check_scope(policy.get('scope'))
-        self._check_responsibilities(policy.get('responsibilities'))
-        self._check_data_handling(policy.get('data_handling'))
-        self._check_incident_response(policy.get('incident_response'))
-        self._check_monitoring(policy.get('monitoring'))
-
-        return self.issues
+        yield from self._check_scope(policy.get('scope'))
+        yield from self._check_responsibilities(policy.get('responsibilities'))
+        yield from self._check_data_handling(policy.get('data_handling'))
+        yield from self._check_incident_response(policy.get('incident_response'))
+        yield from self._check_monitoring(policy.get('monitoring'))
 
-    def _check_required_sections(self, policy: Dict[str, Any]):
+    def _check_required_sections(self, policy: Dict[str, Any]) -> Iterator[PolicyIssue]:
         """Check for presence of required sections."""
         for section in self.REQUIRED_SECTIONS:
             if section not in policy or not policy[section]:
-                self.issues.append(PolicyIssue(
-                    severity='error',
+                yield PolicyIssue(
+                    severity=ERROR,
                     section=section,
                     message=f"Required section '{section}' is missing or empty"
-                ))
+                )
 
-    def _check_recommended_sections(self, policy: Dict[str, Any]):
+    def _check_recommended_sections(self, policy: Dict[str, Any]) -> Iterator[PolicyIssue]:
         """Check for presence of recommended sections."""
         for section in self.RECOMMENDED_SECTIONS:
             if section not in policy or not policy[section]:
-                self.issues.append(PolicyIssue(
-                    severity='warning',
+                yield PolicyIssue(
+                    severity=WARNING,
                     section=section,
                     message=f"Recommended section '{section}' is missing"
-                ))
+                )
 
-    def _check_scope(self, scope: Optional[Dict[str, Any]]):
+    def _check_scope(self, scope: Optional[Dict[str, Any]]) -> Iterator[PolicyIssue]:
         """Check scope section."""
         if not scope:
             return
 
         # Check for key scope elements
         if 'system_description' not in scope:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='scope',
                 message="Missing 'system_description' in scope"
-            ))
+            )
 
         if 'boundaries' not in scope:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='scope',
                 message="Missing 'boundaries' definition in scope"
-            ))
+            )
 
-    def _check_responsibilities(self, responsibilities: Optional[Dict[str, Any]]):
+    def _check_responsibilities(self, responsibilities: Optional[Dict[str, Any]]) -> Iterator[PolicyIssue]:
         """Check responsibilities section."""
         if not responsibilities:
             return
@@ -144,85 +188,85 @@ class PolicyChecker:
         key_roles = ['system_owner', 'incident_responder', 'data_steward']
         for role in key_roles:
             if role not in responsibilities:
-                self.issues.append(PolicyIssue(
-                    severity='info',
+                yield PolicyIssue(
+                    severity=INFO,
                     section='responsibilities',
                     message=f"Consider defining '{role}' role"
-                ))
+                )
 
-    def _check_data_handling(self, data_handling: Optional[Dict[str, Any]]):
+    def _check_data_handling(self, data_handling: Optional[Dict[str, Any]]) -> Iterator[PolicyIssue]:
         """Check data handling section."""
         if not data_handling:
             return
 
         # Check for data handling elements
         if 'retention_policy' not in data_handling:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='data_handling',
                 message="Missing 'retention_policy'"
-            ))
+            )
 
         if 'privacy_measures' not in data_handling:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='data_handling',
                 message="Missing 'privacy_measures'"
-            ))
+            )
 
         if 'data_classification' not in data_handling:
-            self.issues.append(PolicyIssue(
-                severity='info',
+            yield PolicyIssue(
+                severity=INFO,
                 section='data_handling',
                 message="Consider adding 'data_classification'"
-            ))
+            )
 
-    def _check_incident_response(self, incident_response: Optional[Dict[str, Any]]):
+    def _check_incident_response(self, incident_response: Optional[Dict[str, Any]]) -> Iterator[PolicyIssue]:
         """Check incident response section."""
         if not incident_response:
             return
 
         # Check for incident response elements
         if 'severity_levels' not in incident_response:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='incident_response',
                 message="Missing 'severity_levels' definition"
-            ))
+            )
 
         if 'response_procedures' not in incident_response:
-            self.issues.append(PolicyIssue(
-                severity='error',
+            yield PolicyIssue(
+                severity=ERROR,
                 section='incident_response',
                 message="Missing 'response_procedures'"
-            ))
+            )
 
         if 'escalation_path' not in incident_response:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='incident_response',
                 message="Missing 'escalation_path'"
-            ))
+            )
 
-    def _check_monitoring(self, monitoring: Optional[Dict[str, Any]]):
+    def _check_monitoring(self, monitoring: Optional[Dict[str, Any]]) -> Iterator[PolicyIssue]:
         """Check monitoring section."""
         if not monitoring:
             return
 
         # Check for monitoring elements
         if 'metrics' not in monitoring:
-            self.issues.append(PolicyIssue(
-                severity='warning',
+            yield PolicyIssue(
+                severity=WARNING,
                 section='monitoring',
                 message="Missing 'metrics' definition"
-            ))
+            )
 
         if 'alerting' not in monitoring:
-            self.issues.append(PolicyIssue(
-                severity='info',
+            yield PolicyIssue(
+                severity=INFO,
                 section='monitoring',
                 message="Consider defining 'alerting' mechanisms"
-            ))
+            )
 
     def check_policy_file(self, filepath: str) -> List[PolicyIssue]:
         """
@@ -234,13 +278,11 @@ class PolicyChecker:
         Returns:
             List of PolicyIssue objects
         """
-        # Determine file type and load
+        # Determine file type, then parse the raw bytes in one go
         if filepath.endswith('.yaml') or filepath.endswith('.yml'):
-            with open(filepath, 'r') as f:
-                policy = yaml.safe_load(f)
+            policy = yaml.load(Path(filepath).read_bytes(), Loader=_YamlLoader)
         elif filepath.endswith('.json'):
-            with open(filepath, 'r') as f:
-                policy = json.load(f)
+            policy = json.loads(Path(filepath).read_bytes())
         else:
             raise ValueError("Policy file must be YAML or JSON")
 
@@ -248,9 +290,9 @@ class PolicyChecker:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of policy check results."""
-        errors = [i for i in self.issues if i.severity == 'error']
-        warnings = [i for i in self.issues if i.severity == 'warning']
-        infos = [i for i in self.issues if i.severity == 'info']
+        errors = [i for i in self.issues if i.severity == ERROR]
+        warnings = [i for i in self.issues if i.severity == WARNING]
+        infos = [i for i in self.issues if i.severity == INFO]
 
         return {
             'total_issues': len(self.issues),
@@ -269,9 +311,9 @@ class PolicyChecker:
         print(f"\n📋 Policy Check Report")
         print("=" * 60)
 
-        errors = [i for i in self.issues if i.severity == 'error']
-        warnings = [i for i in self.issues if i.severity == 'warning']
-        infos = [i for i in self.issues if i.severity == 'info']
+        errors = [i for i in self.issues if i.severity == ERROR]
+        warnings = [i for i in self.issues if i.severity == WARNING]
+        infos = [i for i in self.issues if i.severity == INFO]
 
         if errors:
             print(f"\n❌ ERRORS ({len(errors)}):")
@@ -5,10 +5,46 @@ Generates comprehensive trust reports from risk registry, policy checks,
 and additional manual notes.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, Iterator, List, Any, Optional, Tuple
+from collections import deque
 from datetime import datetime
-from .risk_registry import RiskRegistry
-from .policy_checker import PolicyChecker
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+from .risk_registry import RiskRegistry, RiskCategory, Severity, HIGH_PRIORITY_SEVERITIES
+from .policy_checker import PolicyChecker, ERROR, WARNING
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+# Directory for the optional on-disk Markdown cache (disabled when unset)
+CACHE_ENV_VAR = "TRUSTREPORT_CACHE"
+
+# Display labels for enum values, e.g. 'data_quality' -> 'Data Quality'
+_SEVERITY_LABELS = {s.value: s.value.title() for s in Severity}
+_CATEGORY_LABELS = {c.value: c.value.replace('_', ' ').title() for c in RiskCategory}
+
+# Severity values listed under "High Priority Risks"
+_HIGH_PRIORITY_VALUES = frozenset(s.value for s in HIGH_PRIORITY_SEVERITIES)
+
+# Risk assessment section for a registry with no risks
+_EMPTY_RISK_LINES = (
+    "## Risk Assessment",
+    "",
+    "### Risk Summary",
+    "",
+    "Total Risks: 0",
+    "",
+    "**By Severity:**",
+    "",
+    "**By Category:**",
+    "",
+    "",
+)
 
 
 class TrustReportBuilder:
@@ -20,98 +56,245 @@ class TrustReportBuilder:
     - Policy compliance checks
     - Manual notes and observations
     - Summary statistics
+
+    The registry and checker are traversed once per set of inputs by
+    build_dict(); the Markdown report is rendered from that dict.
     """
 
+    # Manual notes kept per builder; the oldest are dropped beyond this
+    MAX_NOTES = 1024
+
     def __init__(self):
         """Initialize report builder."""
         self.risk_registry: Optional[RiskRegistry] = None
         self.policy_checker: Optional[PolicyChecker] = None
-        self.manual_notes: List[str] = []
+        self.manual_notes: Deque[str] = deque(maxlen=self.MAX_NOTES)
         self.system_name: str = "AI System"
         self.system_version: str = "1.0.0"
+        self._version = 0
+        self._dict_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+        self._markdown_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
 
     def set_risk_registry(self, registry: RiskRegistry):
         """Set risk registry for report."""
         self.risk_registry = registry
+        self._version += 1
 
     def set_policy_checker(self, checker: PolicyChecker):
         """Set policy checker for report."""
         self.policy_checker = checker
+        self._version += 1
 
     def add_note(self, note: str):
-        """Add manual note to report."""
+        """Add manual note to report (keeps the latest MAX_NOTES notes)."""
         self.manual_notes.append(note)
+        self._version += 1
 
     def set_system_info(self, name: str, version: str = "1.0.0"):
         """Set system name and version."""
         self.system_name = name
         self.system_version = version
+        self._version += 1
+
+    def reset(self):
+        """Clear all report inputs, returning the builder to its initial state."""
+        self.risk_registry = None
+        self.policy_checker = None
+        self.manual_notes.clear()
+        self.system_name = "AI System"
+        self.system_version = "1.0.0"
+        self._version += 1
+        self._dict_cache = None
+        self._markdown_cache = None
+
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """
+        Key identifying the current report inputs, built from counters.
+
+        The builder, registry and checker bump their counters on every change
+        made through their methods. Risk and issue counts also catch entries
+        added to or removed from registry.risks or checker.issues directly.
+        Editing a Risk or PolicyIssue in place is not detected; call
+        set_risk_registry() or set_policy_checker() again to rebuild.
+        """
+        registry = self.risk_registry
+        checker = self.policy_checker
+        return (
+            self._version,
+            self.system_name,
+            self.system_version,
+            tuple(self.manual_notes),
+            (registry.revision, len(registry.risks)) if registry else None,
+            (checker.revision, len(checker.issues)) if checker else None,
+        )
 
     def build_markdown(self) -> str:
         """
         Build trust report in Markdown format.
 
+        The rendered report is memoized until the builder, its risk
+        registry or its policy checker change (see _cache_key()), so
+        repeated calls return the same text. A memoized report keeps the
+        "Generated" timestamp of the build that first produced it.
+
+        If the TRUSTREPORT_CACHE environment variable names a directory,
+        rendered reports are also stored there keyed by a hash of the
+        report content, and later runs with identical content reuse them.
+        The timestamp is not part of that key, so a report served from disk
+        keeps the "Generated" time of the run that first rendered it.
+
         Returns:
             Formatted markdown string
         """
-        lines = []
-
-        # Header
-        lines.append(f"# Trust Report: {self.system_name}")
-        lines.append(f"**Version**: {self.system_version}")
-        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Executive Summary
-        lines.append("## Executive Summary")
-        lines.append("")
-        lines.extend(self._build_executive_summary())
-        lines.append("")
-
-        # Risk Assessment
-        if self.risk_registry:
-            lines.append("## Risk Assessment")
-            lines.append("")
-            lines.extend(self._build_risk_section())
-            lines.append("")
-
-        # Policy Compliance
-        if self.policy_checker and self.policy_checker.issues:
-            lines.append("## Policy Compliance")
-            lines.append("")
-            lines.extend(self._build_policy_section())
-            lines.append("")
-
-        # Manual Notes
-        if self.manual_notes:
-            lines.append("## Additional Notes")
-            lines.append("")
-            for note in self.manual_notes:
-                lines.append(f"- {note}")
-            lines.append("")
-
-        # Recommendations
-        lines.append("## Recommendations")
-        lines.append("")
-        lines.extend(self._build_recommendations())
-        lines.append("")
-
-        # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append("*This report was generated automatically by TrustByDesign toolkit.*")
+        key = self._cache_key()
+        if self._markdown_cache and self._markdown_cache[0] == key:
+            return self._markdown_cache[1]
+
+        report = self._build_dict(key)
+        cache_path = self._disk_cache_path(report)
+        markdown = None
+
+        if cache_path is not None:
+            try:
+                markdown = cache_path.read_text(encoding='utf-8')
+            except OSError:
+                pass
+
+        if markdown is None:
+            markdown = self._render_markdown(report)
+            if cache_path is not None:
+                try:
+                    self._write_disk_cache(cache_path, markdown)
+                except OSError:
+                    pass
+
+        self._markdown_cache = (key, markdown)
+        return markdown
+
+    @staticmethod
+    def _disk_cache_path(report: Dict[str, Any]) -> Optional[Path]:
+        """On-disk cache file for a report, or None if caching is disabled."""
+        cache_dir = os.environ.get(CACHE_ENV_VAR)
+        if not cache_dir:
+            return None
+
+        # The timestamp changes every run, so it is left out of the key;
+        # repr() rather than json.dumps(sort_keys=True), since risk metadata
+        # may mix key types
+        content = {k: v for k, v in report.items() if k != 'generated_at'}
+        digest = hashlib.sha256(repr(content).encode()).hexdigest()
+        return Path(cache_dir) / f"{digest}.md"
+
+    @staticmethod
+    def _write_disk_cache(cache_path: Path, markdown: str):
+        """Write a cache entry atomically, so readers never see a partial file."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        Yield the Markdown report one section at a time.
 
-        return "\n".join(lines)
+        Joining the chunks gives the same text as build_markdown(). A
+        memoized or disk-cached report is yielded as a single chunk.
 
-    def _build_executive_summary(self) -> List[str]:
+        Yields:
+            Markdown text chunks
+        """
+        key = self._cache_key()
+        memoized = self._markdown_cache and self._markdown_cache[0] == key
+        if memoized or os.environ.get(CACHE_ENV_VAR):
+            yield self.build_markdown()
+            return
+
+        yield from self._iter_sections(self._build_dict(key))
+
+    def _iter_sections(self, report: Dict[str, Any]) -> Iterator[str]:
+        """Render each non-empty section of a build_dict() result."""
+        separator = ""
+        for render in self._SECTION_RENDERERS:
+            lines = render(self, report)
+            if lines:
+                yield separator + "\n".join(lines)
+                separator = "\n"
+
+    def _render_markdown(self, report: Dict[str, Any]) -> str:
+        """Render the Markdown report from a build_dict() result."""
+        return "".join(self._iter_sections(report))
+
+    def _render_header(self, report: Dict[str, Any]) -> List[str]:
+        """Title block with system info and generation time."""
+        generated = datetime.fromisoformat(report['generated_at'])
+        return [
+            f"# Trust Report: {report['system']['name']}",
+            f"**Version**: {report['system']['version']}",
+            f"**Generated**: {generated.strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "---",
+            "",
+        ]
+
+    def _render_executive_summary(self, report: Dict[str, Any]) -> List[str]:
+        """Executive summary section."""
+        return ["## Executive Summary", "", *self._build_executive_summary(report), ""]
+
+    def _render_risks(self, report: Dict[str, Any]) -> List[str]:
+        """Risk assessment section, omitted without a risk registry."""
+        if not report['risks']:
+            return []
+        if not report['risks']['details']:
+            return list(_EMPTY_RISK_LINES)
+        return ["## Risk Assessment", "", *self._build_risk_section(report['risks']), ""]
+
+    def _render_policy(self, report: Dict[str, Any]) -> List[str]:
+        """Policy compliance section, omitted when there are no issues."""
+        if not report['policy']:
+            return []
+        return ["## Policy Compliance", "", *self._build_policy_section(report['policy']), ""]
+
+    def _render_notes(self, report: Dict[str, Any]) -> List[str]:
+        """Manual notes section, omitted when there are no notes."""
+        if not report['notes']:
+            return []
+        return ["## Additional Notes", "", *(f"- {note}" for note in report['notes']), ""]
+
+    def _render_recommendations(self, report: Dict[str, Any]) -> List[str]:
+        """Recommendations section."""
+        return ["## Recommendations", "", *self._build_recommendations(report), ""]
+
+    def _render_footer(self, report: Dict[str, Any]) -> List[str]:
+        """Closing rule and attribution line."""
+        return [
+            "---",
+            "",
+            "*This report was generated automatically by TrustByDesign toolkit.*",
+        ]
+
+    # Report sections in output order
+    _SECTION_RENDERERS = (
+        _render_header,
+        _render_executive_summary,
+        _render_risks,
+        _render_policy,
+        _render_notes,
+        _render_recommendations,
+        _render_footer,
+    )
+
+    def _build_executive_summary(self, report: Dict[str, Any]) -> List[str]:
         """Build executive summary section."""
         lines = []
 
         # Risk summary
-        if self.risk_registry:
-            risk_summary = self.risk_registry.get_summary()
+        if report['risks']:
+            risk_summary = report['risks']['summary']
             total_risks = risk_summary['total']
             critical_risks = risk_summary['by_severity'].get('critical', 0)
             high_risks = risk_summary['by_severity'].get('high', 0)
@@ -122,8 +305,8 @@ class TrustReportBuilder:
             lines.append("")
 
         # Policy summary
-        if self.policy_checker and self.policy_checker.issues:
-            policy_summary = self.policy_checker.get_summary()
+        if report['policy']:
+            policy_summary = report['policy']['summary']
             lines.append(f"**Policy Compliance**: {'✅ Passed' if policy_summary['passed'] else '❌ Failed'}")
             lines.append(f"- Errors: {policy_summary['errors']}")
             lines.append(f"- Warnings: {policy_summary['warnings']}")
@@ -131,14 +314,11 @@ class TrustReportBuilder:
 
         return lines
 
-    def _build_risk_section(self) -> List[str]:
+    def _build_risk_section(self, risks: Dict[str, Any]) -> List[str]:
         """Build risk assessment section."""
         lines = []
 
-        if not self.risk_registry:
-            return lines
-
-        risk_summary = self.risk_registry.get_summary()
+        risk_summary = risks['summary']
 
         # Summary statistics
         lines.append("### Risk Summary")
@@ -149,18 +329,17 @@ class TrustReportBuilder:
         # By severity
         lines.append("**By Severity:**")
         for severity, count in risk_summary['by_severity'].items():
-            lines.append(f"- {severity.title()}: {count}")
+            lines.append(f"- {_SEVERITY_LABELS[severity]}: {count}")
         lines.append("")
 
         # By category
         lines.append("**By Category:**")
         for category, count in risk_summary['by_category'].items():
-            lines.append(f"- {category.replace('_', ' ').title()}: {count}")
+            lines.append(f"- {_CATEGORY_LABELS[category]}: {count}")
         lines.append("")
 
         # Top risks (critical and high)
-        critical_risks = self.risk_registry.list_risks(severity=None)
-        high_priority = [r for r in critical_risks if r.severity.value in ['critical', 'high']]
+        high_priority = [r for r in risks['details'] if r['severity'] in _HIGH_PRIORITY_VALUES]
 
         if high_priority:
             lines.append("### High Priority Risks")
@@ -168,57 +347,53 @@ class TrustReportBuilder:
             lines.append("| ID | Title | Severity | Status | Owner |")
             lines.append("|---|---|---|---|---|")
 
-            for risk in sorted(high_priority, key=lambda r: (r.severity.value, r.id)):
+            for risk in sorted(high_priority, key=lambda r: (r['severity'], r['id'])):
                 lines.append(
-                    f"| {risk.id} | {risk.title} | {risk.severity.value} | "
-                    f"{risk.status.value} | {risk.owner or 'Unassigned'} |"
+                    f"| {risk['id']} | {risk['title']} | {risk['severity']} | "
+                    f"{risk['status']} | {risk['owner'] or 'Unassigned'} |"
                 )
             lines.append("")
 
         return lines
 
-    def _build_policy_section(self) -> List[str]:
+    def _build_policy_section(self, policy: Dict[str, Any]) -> List[str]:
         """Build policy compliance section."""
         lines = []
 
-        if not self.policy_checker or not self.policy_checker.issues:
-            lines.append("✅ No policy compliance issues found.")
-            return lines
-
-        summary = self.policy_checker.get_summary()
+        summary = policy['summary']
 
         lines.append(f"**Status**: {'❌ Failed' if not summary['passed'] else '⚠️  Passed with warnings'}")
         lines.append("")
 
         # Errors
-        errors = [i for i in self.policy_checker.issues if i.severity == 'error']
+        errors = [i for i in policy['issues'] if i['severity'] == ERROR]
         if errors:
             lines.append("### Errors")
             lines.append("")
             for issue in errors:
-                lines.append(f"- **{issue.section}**: {issue.message}")
+                lines.append(f"- **{issue['section']}**: {issue['message']}")
             lines.append("")
 
         # Warnings
-        warnings = [i for i in self.policy_checker.issues if i.severity == 'warning']
+        warnings = [i for i in policy['issues'] if i['severity'] == WARNING]
         if warnings:
             lines.append("### Warnings")
             lines.append("")
             for issue in warnings:
-                lines.append(f"- **{issue.section}**: {issue.message}")
+                lines.append(f"- **{issue['section']}**: {issue['message']}")
             lines.append("")
 
         return lines
 
-    def _build_recommendations(self) -> List[str]:
+    def _build_recommendations(self, report: Dict[str, Any]) -> List[str]:
         """Build recommendations section."""
         lines = []
 
         recommendations = []
 
         # Risk-based recommendations
-        if self.risk_registry:
-            risk_summary = self.risk_registry.get_summary()
+        if report['risks']:
+            risk_summary = report['risks']['summary']
 
             critical_count = risk_summary['by_severity'].get('critical', 0)
             if critical_count > 0:
@@ -226,18 +401,15 @@ class TrustReportBuilder:
                     f"🔴 **URGENT**: Address {critical_count} critical risk(s) before deployment"
                 )
 
-            identified_risks = [
-                r for r in self.risk_registry.risks.values()
-                if r.status.value == 'identified'
-            ]
-            if identified_risks:
+            identified_count = risk_summary['by_status'].get('identified', 0)
+            if identified_count:
                 recommendations.append(
-                    f"⚠️  Move {len(identified_risks)} identified risk(s) to active mitigation"
+                    f"⚠️  Move {identified_count} identified risk(s) to active mitigation"
                 )
 
         # Policy-based recommendations
-        if self.policy_checker and self.policy_checker.issues:
-            summary = self.policy_checker.get_summary()
+        if report['policy']:
+            summary = report['policy']['summary']
 
             if summary['errors'] > 0:
                 recommendations.append(
@@ -263,9 +435,20 @@ class TrustReportBuilder:
         """
         Build trust report as dictionary for JSON export.
 
+        The result is memoized on the same key as build_markdown() and
+        shared with it, so treat the returned dict as read-only. A memoized
+        dict keeps its original 'generated_at' timestamp.
+
         Returns:
             Report data as dict
         """
+        return self._build_dict(self._cache_key())
+
+    def _build_dict(self, key: Tuple[Any, ...]) -> Dict[str, Any]:
+        """build_dict() for a key already computed by _cache_key()."""
+        if self._dict_cache and self._dict_cache[0] == key:
+            return self._dict_cache[1]
+
         report = {
             'system': {
                 'name': self.system_name,
@@ -274,7 +457,7 @@ class TrustReportBuilder:
             'generated_at': datetime.now().isoformat(),
             'risks': None,
             'policy': None,
-            'notes': self.manual_notes
+            'notes': list(self.manual_notes)
         }
 
         # Add risk data
@@ -291,15 +474,24 @@ class TrustReportBuilder:
                 'issues': [issue.to_dict() for issue in self.policy_checker.issues]
             }
 
+        self._dict_cache = (key, report)
         return report
 
     def save_markdown(self, filepath: str):
-        """Save trust report as Markdown file."""
+        """Save trust report as Markdown file, writing it section by section."""
         with open(filepath, 'w') as f:
-            f.write(self.build_markdown())
+            f.writelines(self.iter_markdown())
 
     def save_json(self, filepath: str):
-        """Save trust report as JSON file."""
-        import json
+        """Save trust report as JSON file (uses orjson when installed)."""
+        if orjson is not None:
+            Path(filepath).write_bytes(
+                orjson.dumps(
+                    self.build_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
+
         with open(filepath, 'w') as f:
             json.dump(self.build_dict(), f, indent=2)
@@ -4,12 +4,24 @@ Risk Registry Module
 Manages AI system risks with tracking of severity, likelihood, mitigations, and status.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterator, Optional, Any
+from collections import Counter
 from enum import Enum
+from pathlib import Path
+import sys
 import yaml
 import json
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class RiskCategory(Enum):
     """Risk categories for AI systems."""
@@ -52,11 +64,54 @@ class RiskStatus(Enum):
     ACCEPTED = "accepted"
 
 
-@dataclass
+# Severities surfaced as high priority in reports
+HIGH_PRIORITY_SEVERITIES = frozenset({Severity.CRITICAL, Severity.HIGH})
+
+
+def _member_lookup(enum_cls):
+    """
+    Build a raw value -> member converter for an enum.
+
+    Known values are a single dict lookup; anything else goes through the
+    enum constructor, which raises ValueError for unknown values.
+    """
+    by_value = {m.value: m for m in enum_cls}
+
+    def coerce(value):
+        try:
+            return by_value[value]
+        except (KeyError, TypeError):
+            return enum_cls(value)
+
+    return coerce
+
+
+_coerce_category = _member_lookup(RiskCategory)
+_coerce_severity = _member_lookup(Severity)
+_coerce_likelihood = _member_lookup(Likelihood)
+_coerce_status = _member_lookup(RiskStatus)
+
+# Risk fields that accept raw enum values in update_risk()
+_FIELD_COERCERS = {
+    'category': _coerce_category,
+    'severity': _coerce_severity,
+    'likelihood': _coerce_likelihood,
+    'status': _coerce_status,
+}
+
+
+def _intern(value: Any) -> Any:
+    """Intern ids and owners so repeated comparisons are pointer checks."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, eq=False)
 class Risk:
     """
     Represents a single risk in the AI system.
 
+    Risks compare equal and hash by id, matching how the registry keys them.
+
     Attributes:
         id: Unique risk identifier
         category: Risk category (hallucination, privacy, etc.)
@@ -67,7 +122,7 @@ class Risk:
         mitigations: List of mitigation measures
         owner: Person/team responsible
         status: Current risk status
-        metadata: Additional custom fields
+        metadata: Additional custom fields (None when there are none)
     """
     id: str
     category: RiskCategory
@@ -78,7 +133,15 @@ class Risk:
     mitigations: List[str] = field(default_factory=list)
     owner: str = ""
     status: RiskStatus = RiskStatus.IDENTIFIED
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Risk):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert risk to dictionary."""
@@ -92,23 +155,28 @@ class Risk:
             'mitigations': self.mitigations,
             'owner': self.owner,
             'status': self.status.value,
-            'metadata': self.metadata
+            'metadata': self.metadata or {}
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Risk':
-        """Create risk from dictionary."""
+        """
+        Create risk from dictionary.
+
+        Raises:
+            ValueError: If an enum field holds an unknown value
+        """
         return cls(
-            id=data['id'],
-            category=RiskCategory(data['category']),
+            id=_intern(data['id']),
+            category=_coerce_category(data['category']),
             title=data['title'],
             description=data['description'],
-            severity=Severity(data['severity']),
-            likelihood=Likelihood(data['likelihood']),
+            severity=_coerce_severity(data['severity']),
+            likelihood=_coerce_likelihood(data['likelihood']),
             mitigations=data.get('mitigations', []),
-            owner=data.get('owner', ''),
-            status=RiskStatus(data.get('status', 'identified')),
-            metadata=data.get('metadata', {})
+            owner=_intern(data.get('owner', '')),
+            status=_coerce_status(data.get('status', 'identified')),
+            metadata=data.get('metadata')
         )
 
 
@@ -122,6 +190,12 @@ class RiskRegistry:
     def __init__(self):
         """Initialize empty risk registry."""
         self.risks: Dict[str, Risk] = {}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change made through the registry API."""
+        return self._revision
 
     def add_risk(
         self,
@@ -160,6 +234,7 @@ class RiskRegistry:
         if id in self.risks:
             raise ValueError(f"Risk with ID '{id}' already exists")
 
+        id = _intern(id)
         risk = Risk(
             id=id,
             category=category,
@@ -168,12 +243,13 @@ class RiskRegistry:
             severity=severity,
             likelihood=likelihood,
             mitigations=mitigations or [],
-            owner=owner,
+            owner=_intern(owner),
             status=status,
-            metadata=metadata or {}
+            metadata=metadata
         )
 
         self.risks[id] = risk
+        self._revision += 1
         return risk
 
     def update_risk(
@@ -203,17 +279,15 @@ class RiskRegistry:
         for key, value in kwargs.items():
             if hasattr(risk, key):
                 # Convert string enum values to enums
-                if key == 'category' and isinstance(value, str):
-                    value = RiskCategory(value)
-                elif key == 'severity' and isinstance(value, str):
-                    value = Severity(value)
-                elif key == 'likelihood' and isinstance(value, str):
-                    value = Likelihood(value)
-                elif key == 'status' and isinstance(value, str):
-                    value = RiskStatus(value)
+                coerce = _FIELD_COERCERS.get(key)
+                if coerce is not None and isinstance(value, str):
+                    value = coerce(value)
+                elif key == 'owner':
+                    value = _intern(value)
 
                 setattr(risk, key, value)
 
+        self._revision += 1
         return risk
 
     def get_risk(self, id: str) -> Optional[Risk]:
@@ -241,75 +315,106 @@ class RiskRegistry:
         """
         results = list(self.risks.values())
 
-        if category:
-            results = [r for r in results if r.category == category]
-        if severity:
-            results = [r for r in results if r.severity == severity]
-        if status:
-            results = [r for r in results if r.status == status]
+        # Most selective filter first, so later passes scan fewer risks
         if owner:
             results = [r for r in results if r.owner == owner]
+        if status:
+            results = [r for r in results if r.status is status]
+        if severity:
+            results = [r for r in results if r.severity is severity]
+        if category:
+            results = [r for r in results if r.category is category]
 
         return results
 
+    def high_priority_risks(self) -> List[Risk]:
+        """List critical and high severity risks, in registry order."""
+        return [
+            r for r in self.risks.values()
+            if r.severity in HIGH_PRIORITY_SEVERITIES
+        ]
+
+    def iter_risks_as_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield each risk as a dictionary, in registry order."""
+        for risk in self.risks.values():
+            yield risk.to_dict()
+
     def export_risks_to_dict(self) -> List[Dict[str, Any]]:
         """Export all risks as list of dictionaries."""
-        return [risk.to_dict() for risk in self.risks.values()]
+        return list(self.iter_risks_as_dicts())
 
     def to_yaml(self, filepath: str):
-        """Export risks to YAML file."""
-        data = {'risks': self.export_risks_to_dict()}
+        """
+        Export risks to YAML file.
+
+        Risks are dumped one at a time as items of the top-level 'risks'
+        sequence, so the full list of dicts is never held in memory.
+        """
         with open(filepath, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            if not self.risks:
+                f.write("risks: []\n")
+                return
+
+            f.write("risks:\n")
+            for risk_dict in self.iter_risks_as_dicts():
+                yaml.dump(
+                    [risk_dict], f, Dumper=_YamlDumper,
+                    default_flow_style=False, sort_keys=False
+                )
 
     def to_json(self, filepath: str):
-        """Export risks to JSON file."""
+        """Export risks to JSON file (uses orjson when installed)."""
         data = {'risks': self.export_risks_to_dict()}
+        if orjson is not None:
+            Path(filepath).write_bytes(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+            return
+
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=2)
 
     def load_from_yaml(self, filepath: str):
         """Load risks from YAML file."""
         with open(filepath, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         for risk_data in data.get('risks', []):
             risk = Risk.from_dict(risk_data)
             self.risks[risk.id] = risk
+        self._revision += 1
 
     def load_from_json(self, filepath: str):
-        """Load risks from JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        """Load risks from JSON file (uses orjson when installed)."""
+        if orjson is not None:
+            data = orjson.loads(Path(filepath).read_bytes())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
 
         for risk_data in data.get('risks', []):
             risk = Risk.from_dict(risk_data)
             self.risks[risk.id] = risk
+        self._revision += 1
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics of risks."""
         total = len(self.risks)
 
-        by_severity = {}
-        by_status = {}
-        by_category = {}
+        # Count enum members, then convert each distinct member to its value
+        # once; keys stay in first-seen order
+        by_severity = Counter()
+        by_status = Counter()
+        by_category = Counter()
 
         for risk in self.risks.values():
-            # Count by severity
-            sev = risk.severity.value
-            by_severity[sev] = by_severity.get(sev, 0) + 1
-
-            # Count by status
-            stat = risk.status.value
-            by_status[stat] = by_status.get(stat, 0) + 1
-
-            # Count by category
-            cat = risk.category.value
-            by_category[cat] = by_category.get(cat, 0) + 1
+            by_severity[risk.severity] += 1
+            by_status[risk.status] += 1
+            by_category[risk.category] += 1
 
         return {
             'total': total,
-            'by_severity': by_severity,
-            'by_status': by_status,
-            'by_category': by_category
+            'by_severity': {m.value: n for m, n in by_severity.items()},
+            'by_status': {m.value: n for m, n in by_status.items()},
+            'by_category': {m.value: n for m, n in by_category.items()}
         }
@@ -6,8 +6,39 @@ Generates a customized compliance checklist based on safety level and system typ
 """
 
 import argparse
+import functools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import yaml
-from datetime import datetime
+
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+class _ChecklistDumper(_Dumper):
+    """Dumper that writes multi-line strings (the guidance notes) as | blocks."""
+
+
+def _str_presenter(dumper, data):
+    style = '|' if '\n' in data else None
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style=style)
+
+
+# Registered on the subclass so other users of the base dumper are unaffected
+_ChecklistDumper.add_representer(str, _str_presenter)
+
+SAFETY_LEVELS = (1, 2, 3)
+SYSTEM_TYPES = ('agent', 'service', 'tool', 'framework')
+
+# Placeholder entries the user replaces; copied into fresh lists per checklist
+_FILL_IN = ('<FILL_IN>',)
+
+# Default temporal scope indexed by safety level (index 0 unused)
+_TEMPORAL = (None, 'session_only', 'persistent', 'persistent')
 
 
 def generate_checklist(safety_level: int, system_type: str, system_name: str) -> dict:
@@ -22,8 +53,8 @@ def generate_checklist(safety_level: int, system_type: str, system_name: str) ->
             'safety_level': safety_level
         },
         'capabilities': {
-            'allowed': ['<FILL_IN>'],
-            'prohibited': ['<FILL_IN>']
+            'allowed': list(_FILL_IN),
+            'prohibited': list(_FILL_IN)
         },
         'boundaries': {
             'limits': {
@@ -46,7 +77,8 @@ def generate_checklist(safety_level: int, system_type: str, system_name: str) ->
     checklist['test_results'] = get_test_results_template(safety_level)
 
     # Add metadata
-    checklist['validated_at'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+    # UTC, to match the trailing 'Z'
+    checklist['validated_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
     checklist['validator_version'] = '1.0'
 
     # Add guidance notes
@@ -57,11 +89,7 @@ def generate_checklist(safety_level: int, system_type: str, system_name: str) ->
 
 def get_default_temporal_scope(level: int) -> str:
     """Get default temporal scope for safety level."""
-    return {
-        1: 'session_only',
-        2: 'persistent',
-        3: 'persistent'
-    }.get(level, 'session_only')
+    return _TEMPORAL[level] if 1 <= level <= 3 else 'session_only'
 
 
 def get_compliance_checks(level: int) -> dict:
@@ -148,6 +176,7 @@ def get_test_results_template(level: int) -> dict:
     return results
 
 
+@functools.lru_cache(maxsize=8)
 def get_guidance_notes(level: int) -> str:
     """Get guidance notes for the checklist."""
     notes = {
@@ -238,6 +267,43 @@ Key considerations:
     return notes.get(level, "No guidance available for this level")
 
 
+def write_checklist(spec: tuple) -> str:
+    """Generate one checklist from a (level, type, name, output) spec and save it."""
+    level, system_type, name, output = spec
+    checklist = generate_checklist(level, system_type, name)
+    with open(output, 'w') as f:
+        yaml.dump(checklist, f, Dumper=_ChecklistDumper, default_flow_style=False, sort_keys=False)
+    return output
+
+
+def load_batch_specs(path: str) -> list:
+    """
+    Load checklist specs for --batch mode.
+
+    The file is a YAML (or JSON) list of entries with 'level', 'type',
+    'name' and 'output' keys.
+    """
+    with open(path, 'r') as f:
+        entries = yaml.safe_load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a list of checklist specs")
+
+    specs = []
+    for i, entry in enumerate(entries):
+        try:
+            spec = (entry['level'], entry['type'], entry['name'], entry['output'])
+        except (KeyError, TypeError):
+            raise ValueError(f"{path}: entry {i} needs level, type, name and output")
+        if spec[0] not in SAFETY_LEVELS:
+            raise ValueError(f"{path}: entry {i} has invalid level {spec[0]!r}")
+        if spec[1] not in SYSTEM_TYPES:
+            raise ValueError(f"{path}: entry {i} has invalid type {spec[1]!r}")
+        specs.append(spec)
+
+    return specs
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate TrustByDesign compliance checklist',
@@ -249,29 +315,29 @@ Examples:
 
   # Generate and save
   python generate_compliance_checklist.py -l 2 -t agent -n "My Agent" -o checklist.yaml
+
+  # Generate every checklist listed in a specs file, 4 at a time
+  python generate_compliance_checklist.py --batch checklists.yaml -j 4
         """
     )
 
     parser.add_argument(
         '-l', '--level',
         type=int,
-        required=True,
-        choices=[1, 2, 3],
+        choices=SAFETY_LEVELS,
         help='Safety level (1=Observational, 2=Interactive, 3=Autonomous)'
     )
 
     parser.add_argument(
         '-t', '--type',
         type=str,
-        required=True,
-        choices=['agent', 'service', 'tool', 'framework'],
+        choices=SYSTEM_TYPES,
         help='System type'
     )
 
     parser.add_argument(
         '-n', '--name',
         type=str,
-        required=True,
         help='System name'
     )
 
@@ -281,22 +347,78 @@ Examples:
         help='Output file (default: print to stdout)'
     )
 
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='SPECS',
+        help='YAML/JSON list of {level, type, name, output} entries to generate'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for --batch (default: one per CPU)'
+    )
+
     args = parser.parse_args()
 
-    # Generate checklist
-    checklist = generate_checklist(args.level, args.type, args.name)
+    if args.batch:
+        conflicting = [flag for flag, value in (
+            ('-l/--level', args.level), ('-t/--type', args.type),
+            ('-n/--name', args.name), ('-o/--output', args.output),
+        ) if value is not None]
+        if conflicting:
+            parser.error(f"--batch cannot be combined with {', '.join(conflicting)}")
+    elif args.jobs is not None:
+        parser.error("-j/--jobs only applies to --batch")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("-j/--jobs must be at least 1")
+
+    # Batch mode: independent checklists, generated in parallel
+    if args.batch:
+        try:
+            specs = load_batch_specs(args.batch)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            parser.error(str(e))
+
+        # One bad spec (e.g. an unwritable output path) must not abort the
+        # rest, so each result is collected and failures reported at the end
+        failed = []
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {executor.submit(write_checklist, spec): spec for spec in specs}
+            for future in as_completed(futures):
+                output = futures[future][3]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(output)
+                    print(f"❌ Failed to generate {output}: {e}", file=sys.stderr)
+                else:
+                    print(f"✅ Compliance checklist generated: {output}")
+
+        if failed:
+            print(f"\n{len(failed)} of {len(specs)} checklist(s) failed", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.level is None or args.type is None or args.name is None:
+        parser.error("the following arguments are required: -l/--level, -t/--type, -n/--name (or use --batch)")
 
     # Output
     if args.output:
-        with open(args.output, 'w') as f:
-            yaml.dump(checklist, f, default_flow_style=False, sort_keys=False)
+        write_checklist((args.level, args.type, args.name, args.output))
         print(f"✅ Compliance checklist generated: {args.output}")
         print(f"\nNext steps:")
         print(f"1. Review and complete the checklist")
         print(f"2. Implement all required safety protocols")
         print(f"3. Run: python tooling/validate_safety.py --level {args.level} --config {args.output}")
     else:
-        print(yaml.dump(checklist, default_flow_style=False, sort_keys=False))
+        # Dump straight to stdout instead of building the document string;
+        # the extra newline matches the blank line print() used to add
+        checklist = generate_checklist(args.level, args.type, args.name)
+        yaml.dump(checklist, sys.stdout, Dumper=_ChecklistDumper, default_flow_style=False, sort_keys=False)
+        sys.stdout.write("\n")
 
 
 if __name__ == '__main__':
@@ -6,64 +6,253 @@ Validates a system configuration against TrustByDesign safety requirements.
 """
 
 import argparse
+import copy
+import functools
+import hashlib
 import json
+import os
 import sys
-import yaml
-from typing import Dict, List, Tuple
+import tempfile
+from typing import Dict, List, NamedTuple, Tuple
 from pathlib import Path
 
+# Report rules
+_SEP = "=" * 60
+_SUBSEP = "-" * 60
+
+# Fields every system block must define
+_SYSTEM_FIELDS = ('id', 'name', 'version')
+
+# Structural shape the checks below rely on. Only types are constrained;
+# missing sections are reported by the checks themselves.
+_CONFIG_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "system": {"type": "object"},
+        "capabilities": {
+            "type": "object",
+            "properties": {
+                "allowed": {"type": "array"},
+                "prohibited": {"type": "array"},
+            },
+        },
+        "boundaries": {"type": "object"},
+        "compliance_checks": {
+            "type": ["object", "null"],
+            "additionalProperties": {"type": ["object", "null"]},
+        },
+        "governance": {"type": "object"},
+    },
+}
+
+# Draft 7 validator for _CONFIG_SCHEMA, built by _schema_validator() on first
+# use since importing jsonschema dominates start-up; None without jsonschema
+_UNLOADED = object()
+_SCHEMA_VALIDATOR = _UNLOADED
+
+
+def _schema_validator():
+    """Return the config schema validator, or None if jsonschema is missing."""
+    global _SCHEMA_VALIDATOR
+    if _SCHEMA_VALIDATOR is _UNLOADED:
+        try:
+            import jsonschema
+        except ImportError:
+            _SCHEMA_VALIDATOR = None
+        else:
+            _SCHEMA_VALIDATOR = jsonschema.Draft7Validator(_CONFIG_SCHEMA)
+    return _SCHEMA_VALIDATOR
+
+
+class CheckGroup(NamedTuple):
+    """A block of boolean checks under one ``compliance_checks`` key."""
+    key: str
+    heading: str         # may contain {status}: "Required" or "Recommended"
+    min_level: int       # lowest safety level the group runs at
+    required_level: int  # below this level failures are only warnings
+    checks: Tuple[Tuple[str, str, str, str], ...]  # (key, passed, failed, warning)
+
+
+def _checks(label: str, *pairs: Tuple[str, str]) -> Tuple[Tuple[str, str, str, str], ...]:
+    """Expand (key, description) pairs into interned report messages."""
+    return tuple(
+        (key,
+         sys.intern(description),
+         sys.intern(f"{label}: {description}"),
+         sys.intern(f"{label}: {description} (recommended)"))
+        for key, description in pairs
+    )
+
+
+CHECK_GROUPS = (
+    CheckGroup('memory_safety', '🧠 Memory Safety (Level 2+ Required)', 2, 2, _checks(
+        'Memory safety',
+        ('user_can_view', 'Users can view stored data'),
+        ('user_can_delete_specific', 'Users can delete specific items'),
+        ('user_can_delete_all', 'Users can delete all data'),
+        ('deletion_is_complete', 'Deletion is complete'),
+        ('operations_logged', 'Memory operations logged'),
+    )),
+    CheckGroup('transparency', '💡 Transparency ({status})', 1, 2, _checks(
+        'Transparency',
+        ('confidence_levels_present', 'Confidence levels in outputs'),
+        ('reasoning_available', 'Reasoning traces available'),
+        ('sources_cited', 'Sources cited for recalled info'),
+        ('uncertainty_acknowledged', 'Uncertainty acknowledged'),
+    )),
+    CheckGroup('consent_mechanisms', '✋ Consent Mechanisms (Level 2+ Required)', 2, 2, _checks(
+        'Consent',
+        ('explicit_consent_required', 'Explicit consent required'),
+        ('consent_explanation_clear', 'Consent explanation clear'),
+        ('consent_revocable', 'Consent is revocable'),
+        ('revocation_triggers_deletion', 'Revocation triggers deletion'),
+    )),
+    CheckGroup('audit_logging', '📝 Audit Logging (Level 2+ Required)', 2, 2, _checks(
+        'Audit',
+        ('critical_events_logged', 'Critical events logged'),
+        ('log_format_structured', 'Log format structured'),
+        ('log_integrity_verifiable', 'Log integrity verifiable'),
+        ('logs_user_accessible', 'Logs user-accessible'),
+        ('retention_policy_defined', 'Retention policy defined'),
+    )),
+)
+
+# Check methods in report order, with the lowest safety level each runs at
+_SCHEDULE = (
+    (1, '_check_system_info'),
+    (1, '_check_capability_boundaries'),
+    (1, '_check_compliance_groups'),
+    (3, '_check_governance_oversight'),
+)
+
+
+class _FailFast(Exception):
+    """Raised by _fail to abandon the remaining checks in fast-fail mode."""
+
 
 class SafetyValidator:
     """Validates TrustByDesign safety compliance."""
 
-    def __init__(self, safety_level: int):
-        self.safety_level = safety_level
-        self.checks_passed = []
-        self.checks_failed = []
+    # Number of distinct configs whose results are remembered
+    MEMO_SIZE = 32
 
-    def validate(self, config: Dict) -> Tuple[bool, int, List[str]]:
+    def __init__(self, safety_level: int, stream: bool = False, memoize: bool = False):
+        self.safety_level = safety_level
+        self.stream = stream
+        self.memoize = memoize
+        self.n_passed = 0
+        self.n_failed = 0
+        self.checks_failed: List[str] = []
+        self._out: List[str] = []
+        self._fast_fail = False
+        # key -> (all_passed, score, n_passed, n_failed, gaps, report text)
+        self._memo: Dict[tuple, Tuple[bool, int, int, int, Tuple[str, ...], str]] = {}
+        self._checks = tuple(
+            getattr(self, name) for min_level, name in _SCHEDULE
+            if safety_level >= min_level
+        )
+
+    def validate(self, config: Dict, fast_fail: bool = False) -> Tuple[bool, int, List[str]]:
         """
         Validate configuration against safety requirements.
 
-        Returns: (all_passed, score_percentage, gaps)
-        """
-        print(f"\n🔍 Validating TrustByDesign Level {self.safety_level} Compliance\n")
-        print("=" * 60)
+        With fast_fail, checking stops at the first failure; all_passed is
+        still exact but the score and gaps only cover the checks that ran.
 
-        # Run level-appropriate checks
-        self._check_system_info(config)
-        self._check_capability_boundaries(config)
+        With memoize, results are remembered per config content: validating
+        an identical config again restores the earlier counts and gaps and
+        re-prints the earlier report without re-running the checks. Configs
+        JSON cannot encode exactly (dates, mixed-type keys) are not memoized.
 
-        if self.safety_level == 1:
-            self._check_transparency(config, required=False)
+        Returns: (all_passed, score_percentage, gaps)
+        """
+        key = self._memo_key(config, fast_fail) if self.memoize else None
+        if key is not None and key in self._memo:
+            all_passed, score, self.n_passed, self.n_failed, gaps, report = self._memo[key]
+            self.checks_failed = list(gaps)
+            self._write(report)
+            return all_passed, score, self.checks_failed
+
+        self.n_passed = 0
+        self.n_failed = 0
+        self.checks_failed = []
+        self._out.clear()
 
-        if self.safety_level >= 2:
-            self._check_memory_safety(config)
-            self._check_transparency(config, required=True)
-            self._check_consent_mechanisms(config)
-            self._check_audit_logging(config)
+        self._emit(f"\n🔍 Validating TrustByDesign Level {self.safety_level} Compliance\n")
+        self._emit(_SEP)
 
-        if self.safety_level >= 3:
-            self._check_governance_oversight(config)
+        self._fast_fail = fast_fail
+        try:
+            schema = _schema_validator()
+            if schema is not None and not schema.is_valid(config):
+                # Malformed configs would only trip over themselves below
+                self._check_structure(config, schema)
+            else:
+                self._run_checks(config)
+        except _FailFast:
+            self._emit("\n⏭️  Stopping at first failure (--fast-fail)")
+        finally:
+            self._fast_fail = False
 
         # Calculate results
-        total_checks = len(self.checks_passed) + len(self.checks_failed)
-        score = int((len(self.checks_passed) / total_checks * 100)) if total_checks > 0 else 0
-        all_passed = len(self.checks_failed) == 0
+        total_checks = self.n_passed + self.n_failed
+        score = self.n_passed * 100 // total_checks if total_checks > 0 else 0
+        all_passed = self.n_failed == 0
 
         self._print_results(score, all_passed)
 
+        report = "".join(self._out)
+        self._out.clear()
+        if not self.stream:
+            self._write(report)
+
+        if key is not None:
+            if len(self._memo) >= self.MEMO_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._memo[next(iter(self._memo))]
+            self._memo[key] = (
+                all_passed, score, self.n_passed, self.n_failed,
+                tuple(self.checks_failed), report,
+            )
         return all_passed, score, self.checks_failed
 
+    def _memo_key(self, config: Dict, fast_fail: bool):
+        """Memo key for a config, or None if it has no exact JSON encoding."""
+        try:
+            return (fast_fail, json.dumps(config, sort_keys=True))
+        except (TypeError, ValueError):
+            return None
+
+    def _run_checks(self, config: Dict):
+        """Run the level-appropriate checks against a well-formed config."""
+        for check in self._checks:
+            check(config)
+
+    def _check_compliance_groups(self, config: Dict):
+        """Run every CHECK_GROUPS entry that applies at this safety level."""
+        compliance_checks = config.get('compliance_checks') or {}
+        for group in CHECK_GROUPS:
+            if self.safety_level >= group.min_level:
+                self._run_group(compliance_checks, group)
+
+    def _check_structure(self, config: Dict, schema):
+        """Report schema violations for a config that failed pre-validation."""
+        self._emit("\n🧾 Config Structure")
+        self._emit(_SUBSEP)
+
+        errors = sorted(schema.iter_errors(config), key=lambda e: e.json_path)
+        for error in errors:
+            self._fail(f"Config structure: {error.message} (at {error.json_path})")
+
     def _check_system_info(self, config: Dict):
         """Validate system information is complete."""
-        print("\n📋 System Information")
-        print("-" * 60)
+        self._emit("\n📋 System Information")
+        self._emit(_SUBSEP)
 
-        required_fields = ['id', 'name', 'version']
         system = config.get('system', {})
 
-        for field in required_fields:
+        for field in _SYSTEM_FIELDS:
             if field in system and system[field]:
                 self._pass(f"System {field} defined: {system[field]}")
             else:
@@ -71,8 +260,8 @@ class SafetyValidator:
 
     def _check_capability_boundaries(self, config: Dict):
         """Validate capability boundaries are defined."""
-        print("\n🛡️  Capability Boundaries")
-        print("-" * 60)
+        self._emit("\n🛡️  Capability Boundaries")
+        self._emit(_SUBSEP)
 
         capabilities = config.get('capabilities', {})
 
@@ -98,95 +287,26 @@ class SafetyValidator:
         else:
             self._fail("Operational scope not defined")
 
-    def _check_memory_safety(self, config: Dict):
-        """Validate memory safety implementation."""
-        print("\n🧠 Memory Safety (Level 2+ Required)")
-        print("-" * 60)
+    def _run_group(self, compliance_checks: Dict, group: CheckGroup):
+        """Validate one table-driven group from the config's compliance_checks."""
+        required = self.safety_level >= group.required_level
+        self._emit(f"\n{group.heading.format(status='Required' if required else 'Recommended')}")
+        self._emit(_SUBSEP)
 
-        checks = config.get('compliance_checks', {}).get('memory_safety', {})
-
-        required = {
-            'user_can_view': 'Users can view stored data',
-            'user_can_delete_specific': 'Users can delete specific items',
-            'user_can_delete_all': 'Users can delete all data',
-            'deletion_is_complete': 'Deletion is complete',
-            'operations_logged': 'Memory operations logged'
-        }
+        checks_get = (compliance_checks.get(group.key) or {}).get
 
-        for key, description in required.items():
-            if checks.get(key) is True:
-                self._pass(description)
-            else:
-                self._fail(f"Memory safety: {description}")
-
-    def _check_transparency(self, config: Dict, required: bool = True):
-        """Validate transparency implementation."""
-        level_text = "Required" if required else "Recommended"
-        print(f"\n💡 Transparency ({level_text})")
-        print("-" * 60)
-
-        checks = config.get('compliance_checks', {}).get('transparency', {})
-
-        requirements = {
-            'confidence_levels_present': 'Confidence levels in outputs',
-            'reasoning_available': 'Reasoning traces available',
-            'sources_cited': 'Sources cited for recalled info',
-            'uncertainty_acknowledged': 'Uncertainty acknowledged'
-        }
-
-        for key, description in requirements.items():
-            if checks.get(key) is True:
-                self._pass(description)
+        for key, passed, failed, warning in group.checks:
+            if checks_get(key) is True:
+                self._pass(passed)
             elif required:
-                self._fail(f"Transparency: {description}")
-            else:
-                self._warn(f"Transparency: {description} (recommended)")
-
-    def _check_consent_mechanisms(self, config: Dict):
-        """Validate consent implementation."""
-        print("\n✋ Consent Mechanisms (Level 2+ Required)")
-        print("-" * 60)
-
-        checks = config.get('compliance_checks', {}).get('consent_mechanisms', {})
-
-        required = {
-            'explicit_consent_required': 'Explicit consent required',
-            'consent_explanation_clear': 'Consent explanation clear',
-            'consent_revocable': 'Consent is revocable',
-            'revocation_triggers_deletion': 'Revocation triggers deletion'
-        }
-
-        for key, description in required.items():
-            if checks.get(key) is True:
-                self._pass(description)
+                self._fail(failed)
             else:
-                self._fail(f"Consent: {description}")
-
-    def _check_audit_logging(self, config: Dict):
-        """Validate audit logging implementation."""
-        print("\n📝 Audit Logging (Level 2+ Required)")
-        print("-" * 60)
-
-        checks = config.get('compliance_checks', {}).get('audit_logging', {})
-
-        required = {
-            'critical_events_logged': 'Critical events logged',
-            'log_format_structured': 'Log format structured',
-            'log_integrity_verifiable': 'Log integrity verifiable',
-            'logs_user_accessible': 'Logs user-accessible',
-            'retention_policy_defined': 'Retention policy defined'
-        }
-
-        for key, description in required.items():
-            if checks.get(key) is True:
-                self._pass(description)
-            else:
-                self._fail(f"Audit: {description}")
+                self._warn(warning)
 
     def _check_governance_oversight(self, config: Dict):
         """Validate governance oversight (Level 3)."""
-        print("\n⚖️  Governance Oversight (Level 3 Required)")
-        print("-" * 60)
+        self._emit("\n⚖️  Governance Oversight (Level 3 Required)")
+        self._emit(_SUBSEP)
 
         # Check for governance declaration reference
         if 'governance' in config:
@@ -201,69 +321,157 @@ class SafetyValidator:
         else:
             self._fail("External audit not configured (required for Level 3)")
 
+    def _emit(self, line: str):
+        """Record a line of report output, also writing it now when streaming."""
+        self._out.append(line + "\n")
+        if self.stream:
+            sys.stdout.write(line + "\n")
+
+    @staticmethod
+    def _write(text: str):
+        """Write report output, encoded once, in one call."""
+        stdout = sys.stdout
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is None:  # e.g. a StringIO swapped in by a caller
+            stdout.write(text)
+            return
+        stdout.flush()
+        buffer.write(text.encode(stdout.encoding or 'utf-8', stdout.errors or 'strict'))
+
     def _pass(self, check: str):
         """Record passed check."""
-        self.checks_passed.append(check)
-        print(f"  ✅ {check}")
+        self.n_passed += 1
+        self._emit(f"  ✅ {check}")
 
     def _fail(self, check: str):
         """Record failed check."""
+        self.n_failed += 1
         self.checks_failed.append(check)
-        print(f"  ❌ {check}")
+        self._emit(f"  ❌ {check}")
+        if self._fast_fail:
+            raise _FailFast
 
     def _warn(self, check: str):
         """Record warning (not counted in pass/fail)."""
-        print(f"  ⚠️  {check}")
+        self._emit(f"  ⚠️  {check}")
 
     def _print_results(self, score: int, all_passed: bool):
         """Print validation results summary."""
-        print("\n" + "=" * 60)
-        print("\n📊 VALIDATION RESULTS")
-        print("=" * 60)
+        self._emit("\n" + _SEP)
+        self._emit("\n📊 VALIDATION RESULTS")
+        self._emit(_SEP)
 
-        total = len(self.checks_passed) + len(self.checks_failed)
-        print(f"\nChecks Passed: {len(self.checks_passed)} / {total}")
-        print(f"Compliance Score: {score}%")
+        total = self.n_passed + self.n_failed
+        self._emit(f"\nChecks Passed: {self.n_passed} / {total}")
+        self._emit(f"Compliance Score: {score}%")
 
         if all_passed:
-            print("\n✅ STATUS: COMPLIANT")
-            print(f"   System meets all Level {self.safety_level} requirements")
+            self._emit("\n✅ STATUS: COMPLIANT")
+            self._emit(f"   System meets all Level {self.safety_level} requirements")
         elif score >= 80:
-            print("\n⚠️  STATUS: MOSTLY COMPLIANT")
-            print(f"   Address {len(self.checks_failed)} gap(s) before deployment")
+            self._emit("\n⚠️  STATUS: MOSTLY COMPLIANT")
+            self._emit(f"   Address {self.n_failed} gap(s) before deployment")
         else:
-            print("\n❌ STATUS: NON-COMPLIANT")
-            print(f"   Significant gaps must be addressed")
+            self._emit("\n❌ STATUS: NON-COMPLIANT")
+            self._emit(f"   Significant gaps must be addressed")
 
         if self.checks_failed:
-            print("\n🔧 GAPS TO ADDRESS:")
+            self._emit("\n🔧 GAPS TO ADDRESS:")
             for gap in self.checks_failed:
-                print(f"   - {gap}")
+                self._emit(f"   - {gap}")
+
+        self._emit(f"\n{_SEP}\n")
+
+
+def _cache_dir() -> Path:
+    """Directory holding parsed-config caches (honours XDG_CACHE_HOME)."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'trustbydesign'
+
+
+def _cache_path(data: bytes) -> Path:
+    """Cache file for a config, keyed by the SHA-256 of its raw bytes."""
+    return _cache_dir() / f"{hashlib.sha256(data).hexdigest()}.json"
 
-        print("\n" + "=" * 60 + "\n")
 
+def _parse_yaml(source) -> Dict:
+    """Parse YAML bytes or a binary stream, importing PyYAML only when needed."""
+    import yaml
 
-def load_config(filepath: str) -> Dict:
-    """Load configuration from YAML or JSON file."""
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = yaml.CSafeLoader if hasattr(yaml, "CSafeLoader") else yaml.SafeLoader
+    return yaml.load(source, Loader=loader)
+
+
+def _load_yaml_cached(data: bytes) -> Dict:
+    """Parse YAML config bytes, reusing a JSON copy of a previous parse of them."""
+    # Keyed on content, not mtime: edits within mtime granularity and
+    # mtime-preserving restores must never be served a stale parse
+    cache = _cache_path(data)
+    try:
+        return json.loads(cache.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    config = _parse_yaml(data)
+
+    # Best effort: configs JSON can't represent faithfully, or an unwritable
+    # cache directory, just mean the next run parses the YAML again
+    try:
+        payload = json.dumps(config)
+        if json.loads(payload) != config:
+            return config
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp, cache)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return config
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(data: bytes, is_json: bool, use_cache: bool) -> Dict:
+    """
+    Parse config file contents, memoized on the bytes for the life of the process.
+
+    The returned dict is the memoized object itself; load_config() hands
+    out copies of it.
+    """
+    if is_json:
+        return json.loads(data)
+    if use_cache:
+        return _load_yaml_cached(data)
+    return _parse_yaml(data)
+
+
+def load_config(filepath: str, use_cache: bool = True) -> Dict:
+    """Load configuration from YAML or JSON file (callers may mutate the result)."""
     path = Path(filepath)
 
     if not path.exists():
         print(f"❌ Error: Config file not found: {filepath}")
         sys.exit(1)
 
+    if path.suffix not in ['.yaml', '.yml', '.json']:
+        print(f"❌ Error: Unsupported file format: {path.suffix}")
+        sys.exit(1)
+
     try:
-        with open(path, 'r') as f:
-            if path.suffix in ['.yaml', '.yml']:
-                return yaml.safe_load(f)
-            elif path.suffix == '.json':
-                return json.load(f)
-            else:
-                print(f"❌ Error: Unsupported file format: {path.suffix}")
-                sys.exit(1)
+        config = _load_config_cached(path.read_bytes(), path.suffix == '.json', use_cache)
     except Exception as e:
         print(f"❌ Error loading config: {e}")
         sys.exit(1)
 
+    # Copied so one caller's edits never leak into later loads of the same file
+    return copy.deepcopy(config)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -300,14 +508,40 @@ Examples:
         help='Output file for validation results (JSON)'
     )
 
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write --output JSON without indentation'
+    )
+
+    parser.add_argument(
+        '--fast-fail',
+        action='store_true',
+        help='Stop at the first failed check (ignored with --output, which needs the full report)'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Print each check as it runs instead of the whole report at the end'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse YAML configs instead of reusing the on-disk cache'
+    )
+
     args = parser.parse_args()
 
     # Load configuration
-    config = load_config(args.config)
+    config = load_config(args.config, use_cache=not args.no_cache)
 
     # Validate
-    validator = SafetyValidator(args.level)
-    all_passed, score, gaps = validator.validate(config)
+    validator = SafetyValidator(args.level, stream=args.stream)
+    all_passed, score, gaps = validator.validate(
+        config, fast_fail=args.fast_fail and not args.output
+    )
 
     # Save results if requested
     if args.output:
@@ -319,8 +553,11 @@ Examples:
             'gaps': gaps
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            if args.compact:
+                json.dump(results, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(results, f, ensure_ascii=False, indent=2)
 
         print(f"📄 Results saved to: {args.output}\n")
 
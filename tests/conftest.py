@@ -0,0 +1,78 @@
+"""
+Shared fixtures for the TrustByDesign toolkit tests.
+
+Fixtures here are module-scoped and must be treated as read-only; tests
+that need to mutate one should work on a copy.deepcopy() of it.
+"""
+
+import pytest
+from lib.risk_registry import RiskRegistry, RiskCategory, Severity, Likelihood
+from lib.policy_checker import PolicyChecker
+
+
+VALID_POLICY = {
+    'scope': {
+        'system_name': 'Test System',
+        'system_description': 'Test',
+        'boundaries': 'Test'
+    },
+    'responsibilities': {
+        'product_owner': 'Alice'
+    },
+    'data_handling': {
+        'pii_protection': 'Encryption',
+        'privacy_measures': 'Yes'
+    },
+    'incident_response': {
+        'severity_levels': ['P0'],
+        'response_time_p0': '15m',
+        'on_call_team': 'team@example.com',
+        'response_procedures': 'Standard',
+        'escalation_path': 'Standard'
+    },
+    'monitoring': {
+        'dashboards': ['Main'],
+        'metrics': {'accuracy': 0.9}
+    },
+    'escalation': {
+        'triggers': ['User request'],
+        'sla': '2m'
+    }
+}
+
+MINIMAL_POLICY = {
+    'scope': {
+        'system_name': 'Test'
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def valid_policy_checker():
+    """Policy checker that has already checked VALID_POLICY."""
+    checker = PolicyChecker()
+    checker.check_policy(VALID_POLICY)
+    return checker
+
+
+@pytest.fixture(scope="module")
+def minimal_policy_checker():
+    """Policy checker that has already checked MINIMAL_POLICY (many issues)."""
+    checker = PolicyChecker()
+    checker.check_policy(MINIMAL_POLICY)
+    return checker
+
+
+@pytest.fixture(scope="module")
+def critical_risk_registry():
+    """Registry holding a single critical privacy risk."""
+    registry = RiskRegistry()
+    registry.add_risk(
+        id="RISK-001",
+        category=RiskCategory.PRIVACY,
+        title="Critical Privacy Risk",
+        description="Test",
+        severity=Severity.CRITICAL,
+        likelihood=Likelihood.HIGH
+    )
+    return registry
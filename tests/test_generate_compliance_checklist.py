@@ -0,0 +1,76 @@
+"""
+Tests for the generate_compliance_checklist.py command-line tool
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "generate_compliance_checklist.py"
+
+
+def run_script(*args):
+    """Run the checklist generator and capture its output."""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args],
+        capture_output=True, text=True
+    )
+
+
+class TestBatchMode:
+    """Test --batch generation of several checklists"""
+
+    def test_batch_reports_failures_and_keeps_going(self, tmp_path):
+        """Test that one failing spec does not abort the rest of the batch"""
+        good = tmp_path / "good.yaml"
+        bad = tmp_path / "missing-dir" / "bad.yaml"
+        specs = tmp_path / "specs.yaml"
+        specs.write_text(yaml.safe_dump([
+            {'level': 2, 'type': 'agent', 'name': 'Good Agent', 'output': str(good)},
+            {'level': 1, 'type': 'tool', 'name': 'Bad Tool', 'output': str(bad)},
+        ]))
+
+        result = run_script("--batch", str(specs), "-j", "2")
+
+        assert result.returncode == 1
+        assert f"generated: {good}" in result.stdout
+        assert f"Failed to generate {bad}" in result.stderr
+        assert "1 of 2 checklist(s) failed" in result.stderr
+        assert "Traceback" not in result.stderr
+
+        checklist = yaml.safe_load(good.read_text())
+        assert checklist['system']['name'] == 'Good Agent'
+        assert not bad.exists()
+
+    def test_batch_all_succeed(self, tmp_path):
+        """Test that a clean batch exits successfully"""
+        specs = tmp_path / "specs.yaml"
+        outputs = [tmp_path / f"out{i}.yaml" for i in range(2)]
+        specs.write_text(yaml.safe_dump([
+            {'level': 1, 'type': 'tool', 'name': f'Tool {i}', 'output': str(out)}
+            for i, out in enumerate(outputs)
+        ]))
+
+        result = run_script("--batch", str(specs))
+
+        assert result.returncode == 0
+        assert all(out.exists() for out in outputs)
+
+    def test_batch_rejects_single_checklist_flags(self, tmp_path):
+        """Test that --batch cannot be combined with -l/-t/-n/-o"""
+        specs = tmp_path / "specs.yaml"
+        specs.write_text("[]\n")
+
+        result = run_script("--batch", str(specs), "-l", "2", "-o", "x.yaml")
+
+        assert result.returncode == 2
+        assert "--batch cannot be combined with -l/--level, -o/--output" in result.stderr
+
+    def test_jobs_requires_batch(self):
+        """Test that -j is rejected outside batch mode"""
+        result = run_script("-l", "2", "-t", "agent", "-n", "Agent", "-j", "2")
+
+        assert result.returncode == 2
+        assert "-j/--jobs only applies to --batch" in result.stderr
@@ -3,6 +3,7 @@ Tests for PolicyChecker module
 """
 
 import pytest
+import sys
 import tempfile
 import os
 import yaml
@@ -90,15 +91,33 @@ class TestPolicyChecker:
         }
 
         checker = PolicyChecker()
-        issues = checker.check_policy(policy)
 
-        errors = [i for i in issues if i.severity == 'error']
         # Should have errors for missing required sections
-        assert len(errors) > 0
+        assert any(
+            i.section == 'responsibilities' and i.severity == 'error'
+            for i in checker.iter_issues(policy)
+        )
+        assert any(
+            i.section == 'data_handling' and i.severity == 'error'
+            for i in checker.iter_issues(policy)
+        )
+
+    def test_iter_issues_matches_check_policy(self):
+        """Test that iter_issues yields what check_policy records"""
+        policy = {
+            'scope': {
+                'system_name': 'Test'
+            }
+        }
 
-        error_sections = [i.section for i in errors]
-        assert 'responsibilities' in error_sections
-        assert 'data_handling' in error_sections
+        checker = PolicyChecker()
+        streamed = [issue.to_dict() for issue in checker.iter_issues(policy)]
+
+        # Iterating does not record issues on the checker
+        assert len(checker.issues) == 0
+
+        issues = checker.check_policy(policy)
+        assert streamed == [issue.to_dict() for issue in issues]
 
     def test_missing_recommended_section_warning(self):
         """Test that missing recommended section generates warning"""
@@ -365,6 +384,38 @@ class TestPolicyChecker:
         finally:
             os.unlink(temp_path)
 
+    def test_check_policy_results_are_independent(self):
+        """Test that editing returned issues does not change later results"""
+        policy = {'scope': {'system_name': 'Test'}}
+
+        checker = PolicyChecker()
+        first = checker.check_policy(policy)
+        original = [i.to_dict() for i in first]
+        first[0].message = "edited"
+        first.clear()
+
+        assert [i.to_dict() for i in checker.check_policy(policy)] == original
+        assert [i.to_dict() for i in checker.check_policies([policy])[0]] == original
+
+    def test_check_policies_batch(self):
+        """Test checking several policies in one call"""
+        policies = [
+            {'scope': {'system_name': 'Test'}},
+            {},
+            {'scope': {'system_name': 'Test'}},
+        ]
+
+        checker = PolicyChecker()
+        results = checker.check_policies(policies)
+
+        assert len(results) == 3
+        for policy, issues in zip(policies, results):
+            expected = PolicyChecker().check_policy(policy)
+            assert [i.to_dict() for i in issues] == [i.to_dict() for i in expected]
+
+        # Batch checks do not record results on the checker
+        assert len(checker.issues) == 0
+
     def test_empty_policy(self):
         """Test checking completely empty policy"""
         policy = {}
@@ -452,4 +503,5 @@ class TestPolicyChecker:
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
+    # Quick interactive run only; CI invokes pytest with the full plugin set
+    sys.exit(pytest.main([__file__, '-v', '-p', 'no:cacheprovider', '--no-header']))
@@ -3,27 +3,33 @@ Tests for TrustReportBuilder module
 """
 
 import pytest
-import tempfile
-import os
 import json
+import re
 from lib.report_builder import TrustReportBuilder
-from lib.risk_registry import RiskRegistry, RiskCategory, Severity, Likelihood, RiskStatus
+from lib.risk_registry import RiskRegistry, RiskCategory, Severity, Likelihood
 from lib.policy_checker import PolicyChecker
 
 
 class TestReportBuilderBasics:
     """Test basic report builder functionality"""
 
+    @classmethod
+    def setup_class(cls):
+        cls.builder = TrustReportBuilder()
+
+    def setup_method(self):
+        self.builder.reset()
+
     def test_builder_creation(self):
         """Test creating report builder"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         assert builder is not None
         assert builder.system_name == "AI System"
         assert builder.system_version == "1.0.0"
 
     def test_set_system_info(self):
         """Test setting system information"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         builder.set_system_info("TestSystem", "2.0.0")
 
         assert builder.system_name == "TestSystem"
@@ -31,7 +37,7 @@ class TestReportBuilderBasics:
 
     def test_add_note(self):
         """Test adding manual notes"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         builder.add_note("First note")
         builder.add_note("Second note")
 
@@ -39,6 +45,33 @@ class TestReportBuilderBasics:
         assert "First note" in builder.manual_notes
         assert "Second note" in builder.manual_notes
 
+    def test_notes_are_bounded(self):
+        """Test that only the most recent notes are kept"""
+        builder = self.builder
+        for i in range(TrustReportBuilder.MAX_NOTES + 5):
+            builder.add_note(f"Note {i}")
+
+        assert len(builder.manual_notes) == TrustReportBuilder.MAX_NOTES
+        assert "Note 0" not in builder.manual_notes
+        assert builder.manual_notes[-1] == f"Note {TrustReportBuilder.MAX_NOTES + 4}"
+
+    def test_reset(self, critical_risk_registry):
+        """Test that reset clears all report inputs"""
+        builder = self.builder
+        builder.set_system_info("TestSystem", "2.0.0")
+        builder.set_risk_registry(critical_risk_registry)
+        builder.add_note("Stale note")
+        assert "Stale note" in builder.build_markdown()
+
+        builder.reset()
+
+        assert builder.risk_registry is None
+        assert len(builder.manual_notes) == 0
+        assert builder.system_name == "AI System"
+        report = builder.build_markdown()
+        assert "Stale note" not in report
+        assert "Risk Assessment" not in report
+
 
 class TestReportWithRiskRegistry:
     """Test report generation with risk registry"""
@@ -51,84 +84,48 @@ class TestReportWithRiskRegistry:
         builder.set_risk_registry(registry)
         assert builder.risk_registry is registry
 
-    def test_report_includes_risks(self):
+    @pytest.mark.parametrize("risks,expected", [
+        # Single high-severity risk
+        (
+            [("RISK-001", RiskCategory.HALLUCINATION, "Test Hallucination Risk",
+              Severity.HIGH, Likelihood.MEDIUM)],
+            ["RISK-001", "Test Hallucination Risk", "| high |"],
+        ),
+        # Multiple risks: critical and high appear in the high priority
+        # table, RISK-003 is medium severity and may not
+        (
+            [("RISK-001", RiskCategory.HALLUCINATION, "Hallucination Risk",
+              Severity.CRITICAL, Likelihood.HIGH),
+             ("RISK-002", RiskCategory.PRIVACY, "Privacy Risk",
+              Severity.HIGH, Likelihood.LOW),
+             ("RISK-003", RiskCategory.BIAS, "Bias Risk",
+              Severity.MEDIUM, Likelihood.MEDIUM)],
+            ["RISK-001", "RISK-002", "Total Risks: 3"],
+        ),
+        # Empty registry still produces a risk summary
+        ([], ["Total Risks: 0"]),
+    ], ids=["single", "multiple", "empty"])
+    def test_report_with_risks(self, risks, expected):
         """Test that report includes risk information"""
         builder = TrustReportBuilder()
         registry = RiskRegistry()
 
-        # Add a risk
-        registry.add_risk(
-            id="RISK-001",
-            category=RiskCategory.HALLUCINATION,
-            title="Test Hallucination Risk",
-            description="Test description",
-            severity=Severity.HIGH,
-            likelihood=Likelihood.MEDIUM
-        )
-
-        builder.set_risk_registry(registry)
-        report = builder.build_markdown()
-
-        # Report should mention the risk
-        assert "RISK-001" in report
-        assert "Test Hallucination Risk" in report
-        assert "high" in report.lower()
-
-    def test_report_with_multiple_risks(self):
-        """Test report with multiple risks"""
-        builder = TrustReportBuilder()
-        registry = RiskRegistry()
-
-        # Add multiple risks
-        registry.add_risk(
-            id="RISK-001",
-            category=RiskCategory.HALLUCINATION,
-            title="Hallucination Risk",
-            description="Test",
-            severity=Severity.CRITICAL,
-            likelihood=Likelihood.HIGH
-        )
-
-        registry.add_risk(
-            id="RISK-002",
-            category=RiskCategory.PRIVACY,
-            title="Privacy Risk",
-            description="Test",
-            severity=Severity.HIGH,
-            likelihood=Likelihood.LOW
-        )
-
-        registry.add_risk(
-            id="RISK-003",
-            category=RiskCategory.BIAS,
-            title="Bias Risk",
-            description="Test",
-            severity=Severity.MEDIUM,
-            likelihood=Likelihood.MEDIUM
-        )
-
-        builder.set_risk_registry(registry)
-        report = builder.build_markdown()
-
-        # Should include high-priority risks (critical and high)
-        assert "RISK-001" in report
-        assert "RISK-002" in report
-        # RISK-003 is medium severity, may not appear in high priority table
-
-        # Should show risk summary
-        assert "Total Risks: 3" in report
-
-    def test_report_with_no_risks(self):
-        """Test report with empty risk registry"""
-        builder = TrustReportBuilder()
-        registry = RiskRegistry()  # Empty
+        for id, category, title, severity, likelihood in risks:
+            registry.add_risk(
+                id=id,
+                category=category,
+                title=title,
+                description="Test",
+                severity=severity,
+                likelihood=likelihood
+            )
 
         builder.set_risk_registry(registry)
         report = builder.build_markdown()
 
-        # Should still generate report
         assert len(report) > 0
-        assert "Total Risks: 0" in report
+        for text in expected:
+            assert text in report
 
 
 class TestReportWithPolicyChecker:
@@ -142,65 +139,23 @@ class TestReportWithPolicyChecker:
         builder.set_policy_checker(checker)
         assert builder.policy_checker is checker
 
-    def test_report_includes_policy_issues(self):
+    def test_report_includes_policy_issues(self, minimal_policy_checker):
         """Test that report includes policy compliance info"""
         builder = TrustReportBuilder()
-        checker = PolicyChecker()
-
-        # Check a minimal policy (will have issues)
-        policy = {
-            'scope': {
-                'system_name': 'Test'
-            }
-        }
-        checker.check_policy(policy)
 
-        builder.set_policy_checker(checker)
+        # Minimal policy (has issues)
+        builder.set_policy_checker(minimal_policy_checker)
         report = builder.build_markdown()
 
         # Report should include policy compliance section
         assert "Policy Compliance" in report
         # Should show that there are issues
-        assert report.count("❌") > 0 or "Failed" in report
+        assert "❌" in report or "Failed" in report
 
-    def test_report_with_valid_policy(self):
+    def test_report_with_valid_policy(self, valid_policy_checker):
         """Test report with mostly valid policy"""
         builder = TrustReportBuilder()
-        checker = PolicyChecker()
-
-        # Create valid policy
-        policy = {
-            'scope': {
-                'system_name': 'Test System',
-                'system_description': 'Test',
-                'boundaries': 'Test'
-            },
-            'responsibilities': {
-                'product_owner': 'Alice'
-            },
-            'data_handling': {
-                'pii_protection': 'Encryption',
-                'privacy_measures': 'Yes'
-            },
-            'incident_response': {
-                'severity_levels': ['P0'],
-                'response_time_p0': '15m',
-                'on_call_team': 'team@example.com',
-                'response_procedures': 'Standard',
-                'escalation_path': 'Standard'
-            },
-            'monitoring': {
-                'dashboards': ['Main'],
-                'metrics': {'accuracy': 0.9}
-            },
-            'escalation': {
-                'triggers': ['User request'],
-                'sla': '2m'
-            }
-        }
-
-        checker.check_policy(policy)
-        builder.set_policy_checker(checker)
+        builder.set_policy_checker(valid_policy_checker)
         report = builder.build_markdown()
 
         # Should have policy section
@@ -210,9 +165,16 @@ class TestReportWithPolicyChecker:
 class TestReportWithNotes:
     """Test report generation with manual notes"""
 
+    @classmethod
+    def setup_class(cls):
+        cls.builder = TrustReportBuilder()
+
+    def setup_method(self):
+        self.builder.reset()
+
     def test_report_includes_notes(self):
         """Test that report includes manual notes"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         builder.add_note("Important observation")
         builder.add_note("Another note")
 
@@ -224,7 +186,7 @@ class TestReportWithNotes:
 
     def test_report_with_no_notes(self):
         """Test report with no manual notes"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         report = builder.build_markdown()
 
         # Should still generate report
@@ -278,32 +240,25 @@ class TestCompleteReport:
         # Generate report
         report = builder.build_markdown()
 
-        # Verify all sections present
-        assert "Trust Report:" in report
-        assert "Complete System" in report
-        assert "3.0.0" in report
-        assert "Risk Assessment" in report
-        assert "Policy Compliance" in report
-        assert "Additional Notes" in report
-        assert "RISK-001" in report
-        assert "Security Risk" in report
+        # Verify all sections present, scanning the report once
+        needles = {
+            "Trust Report:",
+            "Complete System",
+            "3.0.0",
+            "Risk Assessment",
+            "Policy Compliance",
+            "Additional Notes",
+            "RISK-001",
+            "Security Risk",
+        }
+        pattern = re.compile("|".join(map(re.escape, needles)))
+        found = {m.group() for m in pattern.finditer(report)}
+        assert needles <= found, f"Missing from report: {needles - found}"
 
-    def test_executive_summary(self):
+    def test_executive_summary(self, critical_risk_registry):
         """Test that executive summary is generated"""
         builder = TrustReportBuilder()
-        registry = RiskRegistry()
-
-        # Add critical risk
-        registry.add_risk(
-            id="RISK-001",
-            category=RiskCategory.PRIVACY,
-            title="Critical Privacy Risk",
-            description="Test",
-            severity=Severity.CRITICAL,
-            likelihood=Likelihood.HIGH
-        )
-
-        builder.set_risk_registry(registry)
+        builder.set_risk_registry(critical_risk_registry)
         report = builder.build_markdown()
 
         # Should have executive summary
@@ -326,6 +281,86 @@ class TestReportFormats:
         assert "# Trust Report:" in report
         assert "##" in report  # Section headers
 
+    def test_build_markdown_is_memoized(self):
+        """Test that unchanged inputs reuse the rendered report"""
+        builder = TrustReportBuilder()
+        builder.set_system_info("Test System", "1.0")
+
+        first = builder.build_markdown()
+        assert builder.build_markdown() is first
+
+    def test_build_markdown_cache_invalidated(self):
+        """Test that changes to the builder or registry re-render the report"""
+        builder = TrustReportBuilder()
+        registry = RiskRegistry()
+        builder.set_risk_registry(registry)
+
+        report = builder.build_markdown()
+        assert "Total Risks: 0" in report
+
+        registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="Late Risk",
+            description="Test",
+            severity=Severity.HIGH,
+            likelihood=Likelihood.LOW
+        )
+        report = builder.build_markdown()
+        assert "Total Risks: 1" in report
+        assert "Late Risk" in report
+
+        builder.add_note("Added after first build")
+        assert "Added after first build" in builder.build_markdown()
+
+    def test_build_markdown_direct_risk_edits(self):
+        """Test that direct registry edits re-render once they are visible"""
+        builder = TrustReportBuilder()
+        registry = RiskRegistry()
+        builder.set_risk_registry(registry)
+        risk = registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="Edited Risk",
+            description="Test",
+            severity=Severity.LOW,
+            likelihood=Likelihood.LOW
+        )
+        assert "Critical: 0" in builder.build_markdown()
+
+        # In-place edits are not tracked until the registry is set again
+        risk.severity = Severity.CRITICAL
+        assert "Critical: 0" in builder.build_markdown()
+        builder.set_risk_registry(registry)
+        assert "Critical: 1" in builder.build_markdown()
+        assert builder.build_dict()['risks']['details'][0]['severity'] == 'critical'
+
+        # Adding or deleting entries changes the risk count, which is tracked
+
+        del registry.risks["RISK-001"]
+        assert "Edited Risk" not in builder.build_markdown()
+
+    def test_build_markdown_sees_direct_issue_edits(self):
+        """Test that editing checker issues in place re-renders the report"""
+        builder = TrustReportBuilder()
+        checker = PolicyChecker()
+        checker.check_policy({'name': 'Incomplete Policy'})
+        builder.set_policy_checker(checker)
+        assert "## Policy Compliance" in builder.build_markdown()
+
+        checker.issues.clear()
+        assert "## Policy Compliance" not in builder.build_markdown()
+
+    def test_iter_markdown_matches_build_markdown(self, critical_risk_registry):
+        """Test that streamed sections join to the full report"""
+        builder = TrustReportBuilder()
+        builder.set_risk_registry(critical_risk_registry)
+        builder.add_note("Streamed note")
+
+        chunks = list(builder.iter_markdown())
+        assert len(chunks) > 1
+        assert "".join(chunks) == builder.build_markdown()
+
     def test_build_dict(self):
         """Test building dictionary report"""
         builder = TrustReportBuilder()
@@ -340,6 +375,16 @@ class TestReportFormats:
         assert report_dict['system']['name'] == "Test System"
         assert report_dict['system']['version'] == "1.0"
 
+    def test_build_dict_shared_with_markdown(self):
+        """Test that markdown and dict reports come from one traversal"""
+        builder = TrustReportBuilder()
+        builder.set_system_info("Test System", "1.0")
+
+        report_dict = builder.build_dict()
+        builder.build_markdown()
+
+        assert builder.build_dict() is report_dict
+
     def test_build_dict_with_risks(self):
         """Test dictionary report includes risk data"""
         builder = TrustReportBuilder()
@@ -362,15 +407,10 @@ class TestReportFormats:
         assert 'summary' in report_dict['risks']
         assert 'details' in report_dict['risks']
 
-    def test_build_dict_with_policy(self):
+    def test_build_dict_with_policy(self, minimal_policy_checker):
         """Test dictionary report includes policy data"""
         builder = TrustReportBuilder()
-        checker = PolicyChecker()
-
-        policy = {'scope': {'system_name': 'Test'}}
-        checker.check_policy(policy)
-
-        builder.set_policy_checker(checker)
+        builder.set_policy_checker(minimal_policy_checker)
         report_dict = builder.build_dict()
 
         assert 'policy' in report_dict
@@ -382,49 +422,140 @@ class TestReportFormats:
 class TestReportSaving:
     """Test saving reports to files"""
 
-    def test_save_markdown(self):
+    def test_save_markdown(self, tmp_path):
         """Test saving markdown report to file"""
         builder = TrustReportBuilder()
         builder.set_system_info("Test System", "1.0")
         builder.add_note("Test note")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            builder.save_markdown(temp_path)
-
-            # Verify file was created and contains expected content
-            with open(temp_path, 'r') as f:
-                content = f.read()
+        temp_path = tmp_path / "report.md"
+        builder.save_markdown(temp_path)
 
-            assert "Trust Report:" in content
-            assert "Test System" in content
-            assert "Test note" in content
+        # Verify file was created and contains expected content
+        content = temp_path.read_text()
 
-        finally:
-            os.unlink(temp_path)
+        assert "Trust Report:" in content
+        assert "Test System" in content
+        assert "Test note" in content
 
-    def test_save_json(self):
+    def test_save_json(self, tmp_path):
         """Test saving JSON report to file"""
         builder = TrustReportBuilder()
         builder.set_system_info("Test System", "1.0")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
+        temp_path = tmp_path / "report.json"
+        builder.save_json(temp_path)
+
+        # Verify file was created and is valid JSON
+        with open(temp_path, 'r') as f:
+            data = json.load(f)
+
+        assert data['system']['name'] == "Test System"
+        assert data['system']['version'] == "1.0"
+
+    def test_save_json_non_str_metadata_keys(self, tmp_path):
+        """Test that risk metadata with non-str keys can be saved"""
+        builder = TrustReportBuilder()
+        registry = RiskRegistry()
+        registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="Keyed Risk",
+            description="Test",
+            severity=Severity.LOW,
+            likelihood=Likelihood.LOW,
+            metadata={1: "first review", "ticket": "SEC-9"}
+        )
+        builder.set_risk_registry(registry)
+
+        temp_path = tmp_path / "report.json"
+        builder.save_json(temp_path)
+
+        with open(temp_path, 'r') as f:
+            data = json.load(f)
+
+        assert data['risks']['details'][0]['metadata'] == {
+            "1": "first review", "ticket": "SEC-9"
+        }
+
+
+class TestReportDiskCache:
+    """Test the opt-in on-disk Markdown cache"""
+
+    def test_disk_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test that nothing is written unless the cache is enabled"""
+        monkeypatch.delenv("TRUSTREPORT_CACHE", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        TrustReportBuilder().build_markdown()
 
-        try:
-            builder.save_json(temp_path)
+        assert list(tmp_path.iterdir()) == []
 
-            # Verify file was created and is valid JSON
-            with open(temp_path, 'r') as f:
-                data = json.load(f)
+    def test_disk_cache_reused_across_builders(self, tmp_path, monkeypatch):
+        """Test that identical report content is served from disk"""
+        monkeypatch.setenv("TRUSTREPORT_CACHE", str(tmp_path / "cache"))
 
-            assert data['system']['name'] == "Test System"
-            assert data['system']['version'] == "1.0"
+        first = TrustReportBuilder()
+        first.set_system_info("Cached System", "1.0")
+        report = first.build_markdown()
 
-        finally:
-            os.unlink(temp_path)
+        cached_files = list((tmp_path / "cache").glob("*.md"))
+        assert len(cached_files) == 1
+        assert cached_files[0].read_text(encoding='utf-8') == report
+
+        # Prove the second builder reads the file instead of re-rendering
+        cached_files[0].write_text("cached copy", encoding='utf-8')
+        second = TrustReportBuilder()
+        second.set_system_info("Cached System", "1.0")
+        assert second.build_markdown() == "cached copy"
+
+        # Different content gets its own entry
+        third = TrustReportBuilder()
+        third.set_system_info("Other System", "1.0")
+        assert "Other System" in third.build_markdown()
+        assert len(list((tmp_path / "cache").glob("*.md"))) == 2
+
+    def test_disk_cache_mixed_metadata_keys(self, tmp_path, monkeypatch):
+        """Test that metadata mixing key types can still be cached"""
+        monkeypatch.setenv("TRUSTREPORT_CACHE", str(tmp_path / "cache"))
+        registry = RiskRegistry()
+        registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="Keyed Risk",
+            description="Test",
+            severity=Severity.LOW,
+            likelihood=Likelihood.LOW,
+            metadata={1: 'a', 'b': 2}
+        )
+        builder = TrustReportBuilder()
+        builder.set_risk_registry(registry)
+
+        report = builder.build_markdown()
+        builder.save_markdown(tmp_path / "report.md")
+
+        assert "Total Risks: 1" in report
+        assert (tmp_path / "report.md").read_text() == report
+        assert len(list((tmp_path / "cache").glob("*.md"))) == 1
+
+    def test_disk_cache_write_is_atomic(self, tmp_path, monkeypatch):
+        """Test that a failed cache write leaves no partial entry behind"""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("TRUSTREPORT_CACHE", str(cache_dir))
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("lib.report_builder.os.replace", fail_replace)
+        builder = TrustReportBuilder()
+        assert "# Trust Report:" in builder.build_markdown()
+        assert list(cache_dir.iterdir()) == []
+
+        monkeypatch.undo()
+        monkeypatch.setenv("TRUSTREPORT_CACHE", str(cache_dir))
+        report = TrustReportBuilder().build_markdown()
+        assert [p.suffix for p in cache_dir.iterdir()] == [".md"]
+        assert next(cache_dir.iterdir()).read_text(encoding='utf-8') == report
 
 
 class TestReportContent:
@@ -478,22 +609,10 @@ class TestReportContent:
         # Critical risk should appear in high priority section
         assert "High Priority Risks" in report or "Critical" in report
 
-    def test_recommendations_section(self):
+    def test_recommendations_section(self, critical_risk_registry):
         """Test that report includes recommendations"""
         builder = TrustReportBuilder()
-        registry = RiskRegistry()
-
-        # Add critical risk
-        registry.add_risk(
-            id="RISK-001",
-            category=RiskCategory.PRIVACY,
-            title="Privacy Issue",
-            description="Test",
-            severity=Severity.CRITICAL,
-            likelihood=Likelihood.HIGH
-        )
-
-        builder.set_risk_registry(registry)
+        builder.set_risk_registry(critical_risk_registry)
         report = builder.build_markdown()
 
         # Should have recommendations section
@@ -503,9 +622,16 @@ class TestReportContent:
 class TestEdgeCases:
     """Test edge cases and error conditions"""
 
+    @classmethod
+    def setup_class(cls):
+        cls.builder = TrustReportBuilder()
+
+    def setup_method(self):
+        self.builder.reset()
+
     def test_empty_report(self):
         """Test generating report with no data"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         report = builder.build_markdown()
 
         # Should still generate valid report
@@ -514,7 +640,7 @@ class TestEdgeCases:
 
     def test_none_risk_registry(self):
         """Test with None risk registry"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         # Don't set risk registry (remains None)
 
         report = builder.build_markdown()
@@ -524,7 +650,7 @@ class TestEdgeCases:
 
     def test_none_policy_checker(self):
         """Test with None policy checker"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         # Don't set policy checker (remains None)
 
         report = builder.build_markdown()
@@ -532,20 +658,24 @@ class TestEdgeCases:
         # Should handle gracefully
         assert len(report) > 0
 
-    def test_very_long_note(self):
+    @pytest.mark.parametrize("length", [128, 10_000])
+    def test_very_long_note(self, length):
         """Test with very long manual note"""
-        builder = TrustReportBuilder()
-        long_note = "A" * 10000
+        builder = self.builder
+        long_note = "A" * length
 
         builder.add_note(long_note)
         report = builder.build_markdown()
 
-        # Should handle long content
-        assert long_note in report
+        # Should handle long content: locate the note by its prefix, then
+        # compare the rendered slice rather than searching for the whole note
+        assert len(report) >= length
+        start = report.index("- " + long_note[:64]) + 2
+        assert report[start:start + length] == long_note
 
     def test_special_characters_in_notes(self):
         """Test notes with special markdown characters"""
-        builder = TrustReportBuilder()
+        builder = self.builder
         builder.add_note("Note with # and * and [brackets]")
 
         report = builder.build_markdown()
@@ -5,6 +5,8 @@ Tests for RiskRegistry module
 import pytest
 import tempfile
 import os
+import yaml
+from dataclasses import asdict
 from lib.risk_registry import (
     RiskRegistry,
     Risk,
@@ -82,6 +84,43 @@ class TestRisk:
         assert risk.likelihood == Likelihood.HIGH
         assert risk.status == RiskStatus.MITIGATING
 
+    def test_risk_identity_is_id(self):
+        """Test that risks compare and hash by id"""
+        first = Risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="First",
+            description="Test",
+            severity=Severity.HIGH,
+            likelihood=Likelihood.LOW
+        )
+        renamed = Risk(
+            id="RISK-001",
+            category=RiskCategory.BIAS,
+            title="Renamed",
+            description="Test",
+            severity=Severity.LOW,
+            likelihood=Likelihood.LOW
+        )
+
+        assert first == renamed
+        assert len({first, renamed}) == 1
+        assert first != "RISK-001"
+
+    def test_risk_from_dict_unknown_value(self):
+        """Test that unknown enum values are rejected"""
+        data = {
+            'id': 'RISK-003',
+            'category': 'not_a_category',
+            'title': 'Bad Risk',
+            'description': 'Test',
+            'severity': 'low',
+            'likelihood': 'low'
+        }
+
+        with pytest.raises(ValueError):
+            Risk.from_dict(data)
+
 
 class TestRiskRegistry:
     """Test RiskRegistry class"""
@@ -174,6 +213,24 @@ class TestRiskRegistry:
         assert updated.severity == Severity.CRITICAL
         assert updated.likelihood == Likelihood.HIGH  # unchanged
 
+    def test_update_risk_invalid_value_keeps_filterable(self):
+        """Test that a rejected update leaves the risk filterable"""
+        registry = RiskRegistry()
+
+        registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PERFORMANCE,
+            title="Original Title",
+            description="Original",
+            severity=Severity.LOW,
+            likelihood=Likelihood.HIGH
+        )
+
+        with pytest.raises(ValueError):
+            registry.update_risk(id="RISK-001", severity="extreme")
+
+        assert [r.id for r in registry.list_risks(severity=Severity.LOW)] == ["RISK-001"]
+
     def test_update_nonexistent_risk_raises_error(self):
         """Test that updating nonexistent risk raises error"""
         registry = RiskRegistry()
@@ -349,6 +406,87 @@ class TestRiskRegistry:
         assert len(filtered) == 1
         assert filtered[0].title == "High Privacy Risk"
 
+    def test_list_risks_after_update(self):
+        """Test that filters follow updates and keep registry order"""
+        registry = RiskRegistry()
+
+        for id in ("RISK-001", "RISK-002", "RISK-003"):
+            registry.add_risk(
+                id=id,
+                category=RiskCategory.BIAS,
+                title=f"Risk {id}",
+                description="Test",
+                severity=Severity.LOW,
+                likelihood=Likelihood.LOW
+            )
+
+        registry.update_risk("RISK-003", severity="high")
+        registry.update_risk("RISK-001", severity=Severity.HIGH)
+
+        high = registry.list_risks(severity=Severity.HIGH)
+        assert [r.id for r in high] == ["RISK-001", "RISK-003"]
+        low = registry.list_risks(severity=Severity.LOW)
+        assert [r.id for r in low] == ["RISK-002"]
+
+    def test_list_risks_after_direct_edit(self):
+        """Test that filters see risk attributes assigned directly"""
+        registry = RiskRegistry()
+
+        risk = registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.PRIVACY,
+            title="Edited Risk",
+            description="Test",
+            severity=Severity.LOW,
+            likelihood=Likelihood.LOW
+        )
+        risk.category = RiskCategory.SECURITY
+        risk.severity = Severity.HIGH
+
+        assert registry.list_risks(category=RiskCategory.PRIVACY) == []
+        assert registry.list_risks(severity=Severity.LOW) == []
+        assert [r.id for r in registry.list_risks(
+            category=RiskCategory.SECURITY, severity=Severity.HIGH
+        )] == ["RISK-001"]
+
+    def test_list_risks_after_direct_delete(self):
+        """Test that filters skip risks deleted from registry.risks"""
+        registry = RiskRegistry()
+
+        for id in ("RISK-001", "RISK-002"):
+            registry.add_risk(
+                id=id,
+                category=RiskCategory.BIAS,
+                title=f"Risk {id}",
+                description="Test",
+                severity=Severity.MEDIUM,
+                likelihood=Likelihood.LOW
+            )
+        del registry.risks["RISK-001"]
+
+        assert [r.id for r in registry.list_risks(category=RiskCategory.BIAS)] == ["RISK-002"]
+        assert [r.id for r in registry.list_risks()] == ["RISK-002"]
+
+    def test_high_priority_risks(self):
+        """Test listing critical and high severity risks"""
+        registry = RiskRegistry()
+
+        for id, severity in [("RISK-001", Severity.LOW),
+                             ("RISK-002", Severity.CRITICAL),
+                             ("RISK-003", Severity.MEDIUM),
+                             ("RISK-004", Severity.HIGH)]:
+            registry.add_risk(
+                id=id,
+                category=RiskCategory.SECURITY,
+                title=f"{severity.value} risk",
+                description="Test",
+                severity=severity,
+                likelihood=Likelihood.MEDIUM
+            )
+
+        high_priority = registry.high_priority_risks()
+        assert [r.id for r in high_priority] == ["RISK-002", "RISK-004"]
+
     def test_get_summary(self):
         """Test getting summary statistics"""
         registry = RiskRegistry()
@@ -415,6 +553,33 @@ class TestRiskRegistry:
         assert exported[0]['category'] == "security"
         assert exported[0]['severity'] == "high"
 
+    def test_yaml_matches_single_document_dump(self, tmp_path):
+        """Test that the streamed YAML equals dumping the whole registry"""
+        registry = RiskRegistry()
+        path = tmp_path / "risks.yaml"
+
+        registry.to_yaml(path)
+        assert path.read_text() == yaml.dump({'risks': []})
+
+        for id in ("RISK-001", "RISK-002"):
+            registry.add_risk(
+                id=id,
+                category=RiskCategory.PRIVACY,
+                title=f"Risk {id}",
+                description="Line one\nLine two",
+                severity=Severity.HIGH,
+                likelihood=Likelihood.LOW,
+                mitigations=["Encrypt"],
+                metadata={'score': 3}
+            )
+        registry.to_yaml(path)
+
+        expected = yaml.dump(
+            {'risks': registry.export_risks_to_dict()},
+            default_flow_style=False, sort_keys=False
+        )
+        assert path.read_text() == expected
+
     def test_save_and_load_yaml(self):
         """Test saving and loading from YAML"""
         registry = RiskRegistry()
@@ -513,6 +678,46 @@ class TestRiskRegistry:
         assert risk.metadata['impact_score'] == 8.5
         assert len(risk.metadata['related_incidents']) == 2
 
+    def test_metadata_defaults_to_none(self):
+        """Test that risks without metadata export an empty mapping"""
+        registry = RiskRegistry()
+
+        risk = registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.SECURITY,
+            title="Security Risk",
+            description="Test",
+            severity=Severity.HIGH,
+            likelihood=Likelihood.MEDIUM
+        )
+
+        assert risk.metadata is None
+        assert risk.to_dict()['metadata'] == {}
+        assert "metadata=None" in repr(risk)
+        assert asdict(risk)['metadata'] is None
+
+        risk.metadata = {"reviewed": True}
+        assert risk.to_dict()['metadata'] == {"reviewed": True}
+
+    def test_metadata_keeps_caller_dict(self):
+        """Test that an empty metadata dict passed in is stored as given"""
+        registry = RiskRegistry()
+        metadata = {}
+
+        risk = registry.add_risk(
+            id="RISK-001",
+            category=RiskCategory.SECURITY,
+            title="Security Risk",
+            description="Test",
+            severity=Severity.HIGH,
+            likelihood=Likelihood.MEDIUM,
+            metadata=metadata
+        )
+        metadata["reviewed"] = True
+
+        assert risk.metadata is metadata
+        assert risk.to_dict()['metadata'] == {"reviewed": True}
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
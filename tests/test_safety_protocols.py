@@ -6,7 +6,8 @@ Adapt these tests to your specific system implementation.
 """
 
 import pytest
-from typing import Dict, Any
+from collections import deque
+from typing import Any, Dict, Iterator
 
 
 # ============================================================================
@@ -19,12 +20,16 @@ class MockLevel2Agent:
     Replace this with your actual agent implementation.
     """
 
+    # Oldest audit entries are dropped beyond this
+    MAX_AUDIT_ENTRIES = 10_000
+
     def __init__(self):
         self.memory = {}
-        self.audit_log = []
+        self.audit_log = deque(maxlen=self.MAX_AUDIT_ENTRIES)
         self.user_consent = False
-        self.capabilities = ["analyze_code", "conversation"]
-        self.prohibited = ["network_access", "file_modification"]
+        # Sets, so can_perform() checks membership by hash
+        self.capabilities = frozenset(("analyze_code", "conversation"))
+        self.prohibited = frozenset(("network_access", "file_modification"))
 
     def grant_consent(self):
         self.user_consent = True
@@ -83,7 +88,10 @@ class MockLevel2Agent:
         return response
 
     def get_audit_log(self) -> list:
-        return self.audit_log.copy()
+        return list(self.audit_log)
+
+    def iter_audit_log(self) -> Iterator[Dict]:
+        return iter(self.audit_log)
 
     def _log(self, event_type: str, details: Dict):
         self.audit_log.append({
@@ -102,20 +110,26 @@ def agent():
     return MockLevel2Agent()
 
 
+@pytest.fixture(scope="module")
+def agent_ro():
+    """Shared agent for tests that never change its state."""
+    return MockLevel2Agent()
+
+
 # ============================================================================
 # Level 1 Tests: Capability Boundaries
 # ============================================================================
 
-def test_capability_manifest_exists(agent):
+def test_capability_manifest_exists(agent_ro):
     """Test that agent has defined capabilities."""
-    assert hasattr(agent, 'capabilities')
-    assert len(agent.capabilities) > 0
+    assert hasattr(agent_ro, 'capabilities')
+    assert len(agent_ro.capabilities) > 0
 
 
-def test_prohibited_actions_defined(agent):
+def test_prohibited_actions_defined(agent_ro):
     """Test that prohibited actions are defined."""
-    assert hasattr(agent, 'prohibited')
-    assert len(agent.prohibited) > 0
+    assert hasattr(agent_ro, 'prohibited')
+    assert len(agent_ro.prohibited) > 0
 
 
 def test_allowed_action_succeeds(agent):
@@ -135,7 +149,7 @@ def test_boundary_violation_logged(agent):
     """Test that boundary violations are logged."""
     agent.perform("network_access")  # Prohibited action
 
-    log = agent.get_audit_log()
+    log = agent.iter_audit_log()
     assert any(
         entry["event_type"] == "capability_boundary_violation"
         for entry in log
@@ -211,9 +225,9 @@ def test_memory_operations_logged(agent):
 # Level 2 Tests: Transparency
 # ============================================================================
 
-def test_responses_include_confidence(agent):
+def test_responses_include_confidence(agent_ro):
     """Test that responses include confidence levels."""
-    response = agent.respond("What is 2+2?")
+    response = agent_ro.respond("What is 2+2?")
     assert "confidence" in response
     assert 0.0 <= response["confidence"] <= 1.0
 
@@ -249,7 +263,7 @@ def test_consent_granted_logged(agent):
     """Test that consent grants are logged."""
     agent.grant_consent()
 
-    log = agent.get_audit_log()
+    log = agent.iter_audit_log()
     assert any(entry["event_type"] == "consent_granted" for entry in log)
 
 
@@ -271,7 +285,7 @@ def test_consent_revocation_logged(agent):
     agent.grant_consent()
     agent.revoke_consent()
 
-    log = agent.get_audit_log()
+    log = agent.iter_audit_log()
     assert any(entry["event_type"] == "consent_revoked" for entry in log)
 
 
@@ -279,9 +293,9 @@ def test_consent_revocation_logged(agent):
 # Level 2 Tests: Audit Logging
 # ============================================================================
 
-def test_audit_log_exists(agent):
+def test_audit_log_exists(agent_ro):
     """Test that audit log is accessible."""
-    log = agent.get_audit_log()
+    log = agent_ro.get_audit_log()
     assert isinstance(log, list)
 
 
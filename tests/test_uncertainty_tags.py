@@ -24,6 +24,16 @@ from lib.uncertainty_tags import (
 )
 
 
+# One statement per tag type, tagged once at import
+_SAMPLE_LINES = (
+    tag_fact('Paris is the capital of France.'),
+    tag_estimate('It has approximately 2 million residents.'),
+    tag_unknown("I don't know the exact GDP."),
+    tag_assumption('Assuming current trends continue.'),
+    tag_speculation('It might become even larger in the future.'),
+)
+
+
 class TestTagConstants:
     """Test tag constant definitions"""
 
@@ -392,13 +402,7 @@ class TestIntegration:
 
     def test_complex_document_processing(self):
         """Test processing a complex document"""
-        doc = f"""
-        {tag_fact('Paris is the capital of France.')}
-        {tag_estimate('It has approximately 2 million residents.')}
-        {tag_unknown("I don't know the exact GDP.")}
-        {tag_assumption('Assuming current trends continue.')}
-        {tag_speculation('It might become even larger in the future.')}
-        """
+        doc = "\n        ".join(_SAMPLE_LINES)
 
         # Count all tags
         counts = count_tags(doc)
@@ -425,16 +429,27 @@ class TestIntegration:
             "[ESTIMATE] E. [UNKNOWN] F."
         )
 
-        fact_pct = get_tag_percentage(text, '[FACT]')
-        estimate_pct = get_tag_percentage(text, '[ESTIMATE]')
-        unknown_pct = get_tag_percentage(text, '[UNKNOWN]')
+        # One scan gives every percentage
+        percentages = get_tag_percentage(text)
+        fact_pct = percentages['[FACT]']
+        estimate_pct = percentages['[ESTIMATE]']
+        unknown_pct = percentages['[UNKNOWN]']
 
         # Check percentages sum appropriately
         total_tags = sum(count_tags(text).values())
         assert total_tags == 6
         assert fact_pct > estimate_pct
         assert fact_pct > unknown_pct
+        assert fact_pct == get_tag_percentage(text, '[FACT]')
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
+    import importlib.util
+    import sys
+
+    # Tests share no mutable state, so spread them across cores when
+    # pytest-xdist is installed
+    args = [__file__, '-v']
+    if importlib.util.find_spec('xdist') is not None:
+        args += ['-n', 'auto']
+    sys.exit(pytest.main(args + sys.argv[1:]))
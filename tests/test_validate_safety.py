@@ -0,0 +1,375 @@
+"""
+Tests for the validate_safety.py command-line tool
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "validate_safety.py"
+
+_spec = importlib.util.spec_from_file_location("validate_safety", SCRIPT)
+validate_safety = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_safety)
+
+
+LEVEL1_CONFIG = """\
+system:
+  id: "tool-001"
+  name: "Code Analysis Tool"
+  version: "1.0.0"
+capabilities:
+  allowed: ["code_analysis"]
+  prohibited: ["network_access"]
+boundaries:
+  limits: {max_file_size_mb: 10}
+  scope: {temporal: "session_only"}
+compliance_checks:
+  transparency:
+    confidence_levels_present: true
+    reasoning_available: true
+    sources_cited: true
+    uncertainty_acknowledged: true
+"""
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the on-disk config cache at a temporary directory."""
+    home = tmp_path / "cache-home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    validate_safety._load_config_cached.cache_clear()
+    yield home / "trustbydesign"
+    validate_safety._load_config_cached.cache_clear()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """A Level 1 compliant YAML config."""
+    path = tmp_path / "config.yaml"
+    path.write_text(LEVEL1_CONFIG)
+    return path
+
+
+def run_script(*args, env=None):
+    """Run the validator and capture its output."""
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args],
+        capture_output=True, text=True, encoding='utf-8',
+        env={**os.environ, "PYTHONIOENCODING": "utf-8", **(env or {})}
+    )
+
+
+class TestLoadConfigMemo:
+    """Test the in-process memo of parsed configs"""
+
+    def test_unchanged_file_skips_parse(self, cache_home, config_file):
+        """Test that reloading identical contents reuses the memoized parse"""
+        first = validate_safety.load_config(str(config_file))
+        second = validate_safety.load_config(str(config_file))
+
+        assert second == first
+        assert validate_safety._load_config_cached.cache_info().hits == 1
+
+    def test_loaded_config_is_a_private_copy(self, cache_home, config_file):
+        """Test that mutating one loaded config does not affect later loads"""
+        first = validate_safety.load_config(str(config_file))
+        first['system']['id'] = "mutated"
+        first['capabilities']['allowed'].append("network_access")
+
+        second = validate_safety.load_config(str(config_file))
+
+        assert second is not first
+        assert second['system']['id'] == "tool-001"
+        assert second['capabilities']['allowed'] == ["code_analysis"]
+
+    def test_edit_with_same_mtime_reparses(self, cache_home, config_file):
+        """Test that the memo follows content even when mtime is unchanged"""
+        first = validate_safety.load_config(str(config_file), use_cache=False)
+        stat = config_file.stat()
+
+        config_file.write_text(LEVEL1_CONFIG.replace("tool-001", "tool-002"))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        second = validate_safety.load_config(str(config_file), use_cache=False)
+        assert first['system']['id'] == "tool-001"
+        assert second['system']['id'] == "tool-002"
+
+
+class TestConfigCache:
+    """Test the on-disk JSON cache of parsed YAML configs"""
+
+    def test_cache_miss_writes_entry(self, cache_home, config_file):
+        """Test that a first load parses the YAML and stores a JSON copy"""
+        config = validate_safety.load_config(str(config_file))
+
+        entries = list(cache_home.glob("*.json"))
+        assert len(entries) == 1
+        assert json.loads(entries[0].read_text()) == config
+        assert config['system']['id'] == "tool-001"
+
+    def test_cache_hit_reads_entry(self, cache_home, config_file):
+        """Test that an unchanged config is served from the cache entry"""
+        validate_safety.load_config(str(config_file))
+        entry, = cache_home.glob("*.json")
+        entry.write_text(json.dumps({"system": {"id": "from-cache"}}))
+
+        validate_safety._load_config_cached.cache_clear()
+        config = validate_safety.load_config(str(config_file))
+
+        assert config == {"system": {"id": "from-cache"}}
+
+    def test_edit_with_same_size_and_mtime_invalidates(self, cache_home, config_file):
+        """Test that the cache key follows content, not mtime and size"""
+        validate_safety.load_config(str(config_file))
+        stat = config_file.stat()
+
+        config_file.write_text(LEVEL1_CONFIG.replace("tool-001", "tool-002"))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config_file.stat().st_size == stat.st_size
+
+        validate_safety._load_config_cached.cache_clear()
+        config = validate_safety.load_config(str(config_file))
+
+        assert config['system']['id'] == "tool-002"
+        assert len(list(cache_home.glob("*.json"))) == 2
+
+    def test_no_cache_bypasses_entries(self, cache_home, config_file):
+        """Test that use_cache=False neither reads nor writes the cache"""
+        config = validate_safety.load_config(str(config_file), use_cache=False)
+
+        assert config['system']['id'] == "tool-001"
+        assert not cache_home.exists()
+
+    def test_cli_no_cache_flag(self, tmp_path, config_file):
+        """Test that --no-cache leaves the cache directory untouched"""
+        home = tmp_path / "cli-cache"
+
+        result = run_script("--level", "1", "--config", str(config_file), "--no-cache",
+                            env={"XDG_CACHE_HOME": str(home)})
+        assert result.returncode == 0
+        assert not home.exists()
+
+        result = run_script("--level", "1", "--config", str(config_file),
+                            env={"XDG_CACHE_HOME": str(home)})
+        assert result.returncode == 0
+        assert len(list((home / "trustbydesign").glob("*.json"))) == 1
+
+
+class TestValidateMemo:
+    """Test memoized SafetyValidator.validate results"""
+
+    COMPLETE = {
+        'system': {'id': 'a', 'name': 'A', 'version': '1'},
+        'capabilities': {'allowed': ['x'], 'prohibited': []},
+        'boundaries': {'limits': {}, 'scope': {}},
+    }
+    INCOMPLETE = {'system': {'id': 'b'}}
+
+    def test_two_configs_in_a_row(self, capsys):
+        """Test that each run and each memo hit reports its own config"""
+        validator = validate_safety.SafetyValidator(1, memoize=True)
+
+        first = validator.validate(self.COMPLETE)
+        first_state = (validator.n_passed, validator.n_failed, list(validator.checks_failed))
+        first_report = capsys.readouterr().out
+
+        second = validator.validate(self.INCOMPLETE)
+        assert second[0] is False
+        assert (validator.n_passed, validator.n_failed) == (1, 6)
+        assert validator.checks_failed == second[2]
+        capsys.readouterr()
+
+        again = validator.validate(self.COMPLETE)
+        assert again == first
+        assert (validator.n_passed, validator.n_failed, validator.checks_failed) == first_state
+        assert capsys.readouterr().out == first_report
+        assert "Checks Passed: 7 / 7" in first_report
+
+    def test_memo_hit_returns_independent_gaps(self):
+        """Test that callers mutating returned gaps do not change the memo"""
+        validator = validate_safety.SafetyValidator(1, memoize=True)
+
+        gaps = validator.validate(self.INCOMPLETE)[2]
+        gaps.clear()
+
+        assert len(validator.validate(self.INCOMPLETE)[2]) == 6
+
+    def test_memo_is_bounded(self):
+        """Test that the memo evicts its oldest entry"""
+        class SmallMemoValidator(validate_safety.SafetyValidator):
+            MEMO_SIZE = 2
+
+        validator = SmallMemoValidator(1, memoize=True)
+        for i in range(3):
+            validator.validate({'system': {'id': str(i)}})
+
+        assert len(validator._memo) == 2
+
+    def test_memo_is_off_by_default(self):
+        """Test that validators only memoize when asked to"""
+        validator = validate_safety.SafetyValidator(1)
+        validator.validate(self.COMPLETE)
+        validator.validate(self.COMPLETE)
+
+        assert validator._memo == {}
+
+    def test_configs_without_exact_json_are_not_memoized(self):
+        """Test that values JSON cannot encode never share a memo key"""
+        validator = validate_safety.SafetyValidator(1, memoize=True)
+
+        validator.validate({'system': {'id': 'a', 'name': date(2025, 1, 1)}})
+        validator.validate({'system': {'id': 'a', 1: 'x', 'name': 'A'}})
+
+        assert validator._memo == {}
+
+
+class TestSchemaPrevalidation:
+    """Test the optional jsonschema structure check"""
+
+    def test_jsonschema_imported_on_first_use(self):
+        """Test that importing the script does not import jsonschema"""
+        pytest.importorskip("jsonschema")
+        code = (
+            "import importlib.util, sys\n"
+            f"spec = importlib.util.spec_from_file_location('v', {str(SCRIPT)!r})\n"
+            "module = importlib.util.module_from_spec(spec)\n"
+            "spec.loader.exec_module(module)\n"
+            "print('jsonschema' in sys.modules)\n"
+            "module.SafetyValidator(1).validate({})\n"
+            "print('jsonschema' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.stdout.splitlines()[0] == "False"
+        assert result.stdout.splitlines()[-1] == "True"
+
+    def test_schema_invalid_config_reports_gaps(self, capsys):
+        """Test that malformed sections become gaps without running checks"""
+        pytest.importorskip("jsonschema")
+        validator = validate_safety.SafetyValidator(2)
+
+        all_passed, score, gaps = validator.validate({
+            'system': 'not-a-mapping',
+            'capabilities': ['a', 'b'],
+            'compliance_checks': {'transparency': True},
+        })
+
+        assert (all_passed, score) == (False, 0)
+        assert gaps == [
+            "Config structure: ['a', 'b'] is not of type 'object' (at $.capabilities)",
+            "Config structure: True is not of type 'object', 'null' (at $.compliance_checks.transparency)",
+            "Config structure: 'not-a-mapping' is not of type 'object' (at $.system)",
+        ]
+        out = capsys.readouterr().out
+        assert "🧾 Config Structure" in out
+        assert "📋 System Information" not in out
+
+    def test_non_mapping_config_reports_gap(self):
+        """Test that a top-level list is rejected instead of crashing"""
+        pytest.importorskip("jsonschema")
+
+        _, _, gaps = validate_safety.SafetyValidator(1).validate([1, 2])
+
+        assert gaps == ["Config structure: [1, 2] is not of type 'object' (at $)"]
+
+    def test_well_formed_config_runs_checks(self, monkeypatch):
+        """Test that results match with and without the schema check"""
+        config = {'system': {'id': 'a'}, 'compliance_checks': None}
+        with_schema = validate_safety.SafetyValidator(2).validate(config)
+
+        monkeypatch.setattr(validate_safety, "_SCHEMA_VALIDATOR", None)
+        without_schema = validate_safety.SafetyValidator(2).validate(config)
+
+        assert with_schema == without_schema
+        assert "System name missing or empty" in with_schema[2]
+
+
+class TestFastFail:
+    """Test stopping at the first failed check"""
+
+    def test_validate_stops_at_first_failure(self, capsys):
+        """Test that fast_fail records one gap and skips later sections"""
+        validator = validate_safety.SafetyValidator(2)
+
+        all_passed, _, gaps = validator.validate({'system': {'id': 'a'}}, fast_fail=True)
+
+        assert all_passed is False
+        assert gaps == ["System name missing or empty"]
+        assert (validator.n_passed, validator.n_failed) == (1, 1)
+        out = capsys.readouterr().out
+        assert "Stopping at first failure" in out
+        assert "Capability Boundaries" not in out
+
+    def test_cli_fast_fail_exit_code(self, cache_home, tmp_path):
+        """Test that --fast-fail keeps the exit code but shortens the run"""
+        config = tmp_path / "partial.yaml"
+        config.write_text("system: {id: a}\n")
+
+        result = run_script("--level", "2", "--config", str(config), "--fast-fail",
+                            env={"XDG_CACHE_HOME": str(cache_home)})
+
+        assert result.returncode == 1
+        assert "Stopping at first failure" in result.stdout
+        assert "Memory Safety" not in result.stdout
+
+    def test_cli_fast_fail_ignored_with_output(self, cache_home, tmp_path):
+        """Test that --output still gets every gap under --fast-fail"""
+        config = tmp_path / "partial.yaml"
+        config.write_text("system: {id: a}\n")
+        output = tmp_path / "results.json"
+
+        result = run_script("--level", "1", "--config", str(config), "--fast-fail",
+                            "--output", str(output),
+                            env={"XDG_CACHE_HOME": str(cache_home)})
+
+        assert result.returncode == 1
+        assert "Stopping at first failure" not in result.stdout
+        assert len(json.loads(output.read_text())['gaps']) == 6
+
+
+class TestJsonOutput:
+    """Test the --output results file"""
+
+    def run_with_output(self, tmp_path, config_file, *flags):
+        output = tmp_path / "results.json"
+        result = run_script("--level", "1", "--config", str(config_file),
+                            "--output", str(output), "--no-cache", *flags)
+        assert result.returncode == 0
+        return output.read_text(encoding='utf-8')
+
+    def test_normal_output_is_indented(self, tmp_path, config_file):
+        """Test that results are pretty-printed by default"""
+        text = self.run_with_output(tmp_path, config_file)
+
+        assert text.startswith('{\n  "config_file": ')
+        assert json.loads(text)['compliance_score'] == 100
+
+    def test_compact_output_is_single_line(self, tmp_path, config_file):
+        """Test that --compact writes the same data without whitespace"""
+        normal = json.loads(self.run_with_output(tmp_path, config_file))
+        text = self.run_with_output(tmp_path, config_file, "--compact")
+
+        assert "\n" not in text
+        assert '"safety_level":1,' in text
+        assert json.loads(text) == normal
+
+    def test_output_keeps_non_ascii(self, tmp_path):
+        """Test that results are written as UTF-8 rather than escaped"""
+        config = tmp_path / "système" / "config.json"
+        config.parent.mkdir()
+        config.write_text(json.dumps({'system': {'id': 'a'}}))
+        output = tmp_path / "results.json"
+
+        run_script("--level", "1", "--config", str(config), "--output", str(output),
+                   "--compact", "--no-cache")
+
+        text = output.read_text(encoding='utf-8')
+        assert "système" in text
+        assert "\\u" not in text